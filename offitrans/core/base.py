@@ -162,6 +162,31 @@ class BaseTranslator(ABC):
             logger.info(f"Batch translation completed: {len(results)} results")
             return results
 
+    def translate_text_sequential(self, texts: List[str]) -> List[str]:
+        """
+        Translate texts one after another in the calling thread.
+
+        For callers that run their own thread pool, so that no second level
+        of workers is started. Errors are handled as in translate_text_batch.
+
+        Args:
+            texts: List of text strings to translate.
+
+        Returns:
+            List of translated text strings.
+        """
+        results: List[str] = []
+        for text in texts:
+            try:
+                result = self.translate_text(text)
+                results.append(result if result is not None else "")
+                self._update_stats(success=True, chars=len(text))
+            except Exception as exc:
+                logger.error(f"Translation failed: {exc}")
+                results.append(text)  # Return original text on error
+                self._update_stats(success=False)
+        return results
+
     def translate_text_batch_simple(self, texts: List[str]) -> List[str]:
         """
         Simple multithreaded version using map (for backward compatibility).
@@ -6,7 +6,6 @@ and improve performance by storing previously translated text.
 """
 
 import json
-import os
 import hashlib
 import atexit
 import threading
@@ -90,9 +89,14 @@ class TranslationCache:
                     backup_file = self.cache_file.with_suffix(".bak")
                     self.cache_file.rename(backup_file)
 
-                # Write new cache file
+                # Write new cache file. Compact one-shot encoding lets json use
+                # its C encoder, which indent= (or streaming json.dump) bypasses
                 with open(self.cache_file, "w", encoding="utf-8") as f:
-                    json.dump(self._cache, f, ensure_ascii=False, indent=2)
+                    f.write(
+                        json.dumps(
+                            self._cache, ensure_ascii=False, separators=(",", ":")
+                        )
+                    )
 
                 # Remove backup on successful write
                 backup_file = self.cache_file.with_suffix(".bak")
@@ -310,8 +314,9 @@ def cached_translation(cache_instance: Optional[TranslationCache] = None):
                 logger.debug(f"Cache disabled, calling API directly: {text[:50]}...")
                 return translate_func(self, text)
 
-            # Use specified cache instance or global cache
-            cache = cache_instance or _global_cache
+            # Use specified cache instance or global cache (an empty cache is
+            # falsy through __len__, so test for None explicitly)
+            cache = cache_instance if cache_instance is not None else _global_cache
 
             # Try to get from cache first
             cached_result = cache.get(text, self.source_lang, self.target_lang)
@@ -323,11 +328,10 @@ def cached_translation(cache_instance: Optional[TranslationCache] = None):
             logger.debug(f"Cache miss, calling API: {text[:50]}...")
             result = translate_func(self, text)
 
-            # Store result in cache (force save for individual translations)
+            # Store result in cache; the file is rewritten every
+            # auto_save_interval entries and on exit rather than per text
             if result and result != text:  # Only cache successful translations
-                cache.set(
-                    text, result, self.source_lang, self.target_lang, force_save=True
-                )
+                cache.set(text, result, self.source_lang, self.target_lang)
 
             return result
 
@@ -62,6 +62,12 @@ class ProcessorConfig:
     preserve_formatting: bool = True
     image_protection: bool = True
     smart_column_width: bool = True
+    fast_extract: bool = True
+    fast_save: bool = False
+    translate_workers: int = 8
+    translate_chunk_chars: int = 4000
+    pdf_extract_workers: int = 1
+    pdf_backend: str = "pypdf2"
 
 
 class Config:
@@ -195,6 +201,28 @@ class Config:
             self.processor.smart_column_width = (
                 os.getenv("OFFITRANS_SMART_COLUMN_WIDTH").lower() == "true"
             )
+        if os.getenv("OFFITRANS_FAST_EXTRACT"):
+            self.processor.fast_extract = (
+                os.getenv("OFFITRANS_FAST_EXTRACT").lower() == "true"
+            )
+        if os.getenv("OFFITRANS_FAST_SAVE"):
+            self.processor.fast_save = (
+                os.getenv("OFFITRANS_FAST_SAVE").lower() == "true"
+            )
+        if os.getenv("OFFITRANS_TRANSLATE_WORKERS"):
+            self.processor.translate_workers = int(
+                os.getenv("OFFITRANS_TRANSLATE_WORKERS")
+            )
+        if os.getenv("OFFITRANS_TRANSLATE_CHUNK_CHARS"):
+            self.processor.translate_chunk_chars = int(
+                os.getenv("OFFITRANS_TRANSLATE_CHUNK_CHARS")
+            )
+        if os.getenv("OFFITRANS_PDF_EXTRACT_WORKERS"):
+            self.processor.pdf_extract_workers = int(
+                os.getenv("OFFITRANS_PDF_EXTRACT_WORKERS")
+            )
+        if os.getenv("OFFITRANS_PDF_BACKEND"):
+            self.processor.pdf_backend = os.getenv("OFFITRANS_PDF_BACKEND").lower()
 
         # General settings
         if os.getenv("OFFITRANS_DEBUG"):
@@ -326,6 +354,18 @@ class Config:
             if self.processor.font_size_adjustment <= 0:
                 logger.error("font_size_adjustment must be positive")
                 return False
+            if self.processor.translate_workers <= 0:
+                logger.error("translate_workers must be positive")
+                return False
+            if self.processor.translate_chunk_chars <= 0:
+                logger.error("translate_chunk_chars must be positive")
+                return False
+            if self.processor.pdf_extract_workers < 0:
+                logger.error("pdf_extract_workers must not be negative")
+                return False
+            if self.processor.pdf_backend not in ("pypdf2", "pymupdf"):
+                logger.error("pdf_backend must be 'pypdf2' or 'pymupdf'")
+                return False
 
             return True
 
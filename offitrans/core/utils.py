@@ -134,6 +134,39 @@ def clean_text(text: str) -> str:
     return cleaned
 
 
+# Patterns used by should_translate_text, compiled once at import
+_PURE_SYMBOLS = re.compile(r"[\W_]+")
+_PURE_LETTERS = re.compile(r"[a-zA-Z]+")
+_ALPHANUMERIC = re.compile(r"[a-zA-Z0-9]+")
+_DIGIT = re.compile(r"\d")
+_LETTER = re.compile(r"[a-zA-Z]")
+_NUMBER_WITH_SYMBOLS = re.compile(r"[\d\W_]+")
+_URL_OR_EMAIL = re.compile(r"https?://|www\.|@.*\.|\.com|\.org|\.net|\.edu")
+_FILE_PATH = re.compile(
+    r"[A-Za-z]:\\|/[a-zA-Z]|\.exe|\.dll|\.pdf|\.docx?|\.xlsx?|\.pptx?"
+)
+_IDENTIFIER = re.compile(r"[a-zA-Z]+_[a-zA-Z]+|[a-z]+[A-Z][a-z]*")
+_MEASUREMENT = re.compile(
+    r"\d+\s*(mm|cm|m|km|kg|g|ml|l|°C|°F|%|px|pt|em|rem|in|ft)", re.IGNORECASE
+)
+_VERSION = re.compile(r"v\d+\.\d+|ver\.\d+|version\s*\d+")
+_DATE = re.compile(r"\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{4}")
+_TIME = re.compile(r"\d{1,2}:\d{2}(\s*(AM|PM))?")
+_CHINESE = re.compile(r"[\u4e00-\u9fff]")
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+_LABEL_WITH_NUMBER = re.compile(r"[A-Za-z]+\s*\d+|\d+\s*[A-Za-z]+")
+_UPPER_OR_DIGIT = re.compile(r"[A-Z0-9]+")
+
+# Common technical abbreviations/codes that are never translated
+_COMMON_CODES = frozenset(
+    {
+        "ID", "URL", "API", "XML", "JSON", "HTML", "CSS", "SQL", "HTTP", "HTTPS",
+        "FTP", "SSH", "TCP", "UDP", "IP", "DNS", "SSL", "TLS", "VPN",
+        "OK", "NO", "YES", "ON", "OFF", "MAX", "MIN", "AVG", "SUM"
+    }
+)
+
+
 def should_translate_text(text: str) -> bool:
     """
     Determine if a text should be translated based on content analysis.
@@ -154,51 +187,47 @@ def should_translate_text(text: str) -> bool:
         return False
 
     # Skip pure symbols
-    if re.fullmatch(r"[\W_]+", text):
+    if _PURE_SYMBOLS.fullmatch(text):
         return False
 
     # Skip very short pure English letters (like single letters or obvious codes)
-    if re.fullmatch(r"[a-zA-Z]+", text) and len(text) <= 2:
+    if len(text) <= 2 and _PURE_LETTERS.fullmatch(text):
         return False
 
     # Skip obvious alphanumeric codes (mixed letters and numbers)
-    if re.fullmatch(r"[a-zA-Z0-9]+", text) and re.search(r"\d", text) and re.search(r"[a-zA-Z]", text):
+    if _ALPHANUMERIC.fullmatch(text) and _DIGIT.search(text) and _LETTER.search(text):
         return False
 
     # Skip numbers with symbols (prices, percentages, measurements)
-    if re.fullmatch(r"[\d\W_]+", text):
+    if _NUMBER_WITH_SYMBOLS.fullmatch(text):
         return False
 
     # Skip URLs and emails
-    if re.search(r"https?://|www\.|@.*\.|\.com|\.org|\.net|\.edu", text.lower()):
+    if _URL_OR_EMAIL.search(text.lower()):
         return False
 
     # Skip file paths
-    if re.search(
-        r"[A-Za-z]:\\|/[a-zA-Z]|\.exe|\.dll|\.pdf|\.docx?|\.xlsx?|\.pptx?", text
-    ):
+    if _FILE_PATH.search(text):
         return False
 
     # Skip programming identifiers (underscore or camelCase)
-    if re.search(r"[a-zA-Z]+_[a-zA-Z]+|[a-z]+[A-Z][a-z]*", text):
+    if _IDENTIFIER.search(text):
         return False
 
     # Skip measurements and units
-    if re.fullmatch(
-        r"\d+\s*(mm|cm|m|km|kg|g|ml|l|°C|°F|%|px|pt|em|rem|in|ft)", text, re.IGNORECASE
-    ):
+    if _MEASUREMENT.fullmatch(text):
         return False
 
     # Skip version numbers
-    if re.search(r"v\d+\.\d+|ver\.\d+|version\s*\d+", text.lower()):
+    if _VERSION.search(text.lower()):
         return False
 
     # Skip date formats
-    if re.search(r"\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{4}", text):
+    if _DATE.search(text):
         return False
 
     # Skip time formats
-    if re.search(r"\d{1,2}:\d{2}(\s*(AM|PM))?", text.upper()):
+    if _TIME.search(text.upper()):
         return False
 
     # Skip formulas (starting with =)
@@ -206,36 +235,32 @@ def should_translate_text(text: str) -> bool:
         return False
 
     # Translate if contains Chinese characters
-    if re.search(r"[\u4e00-\u9fff]", text):
+    if _CHINESE.search(text):
         return True
 
     # Translate if contains other non-ASCII characters (except symbols)
-    if re.search(r"[^\x00-\x7f]", text) and not re.fullmatch(r"[\W_]+", text):
+    if _NON_ASCII.search(text) and not _PURE_SYMBOLS.fullmatch(text):
         return True
 
     # For English text with spaces (potential phrases/sentences)
-    if " " in text and re.search(r"[a-zA-Z]", text):
+    if " " in text and _LETTER.search(text):
         # Skip simple labels like "Item 1", "Page 2"
-        if re.fullmatch(r"[A-Za-z]+\s*\d+|\d+\s*[A-Za-z]+", text):
+        if _LABEL_WITH_NUMBER.fullmatch(text):
             return False
+        words = len(text.split())
         # Skip short combinations like "ID ABC123"
-        if len(text.split()) <= 2 and re.search(r"[A-Z0-9]+", text):
+        if words <= 2 and _UPPER_OR_DIGIT.search(text):
             return False
         # Translate longer English phrases (3+ words or complex content)
-        if len(text.split()) >= 3 or len(text) > 20:
+        if words >= 3 or len(text) > 20:
             return True
 
     # For single English words (meaningful words that should be translated)
-    if re.fullmatch(r"[a-zA-Z]+", text) and len(text) >= 3:
+    if len(text) >= 3 and _PURE_LETTERS.fullmatch(text):
         # Skip common technical abbreviations/codes
-        common_codes = {
-            "ID", "URL", "API", "XML", "JSON", "HTML", "CSS", "SQL", "HTTP", "HTTPS",
-            "FTP", "SSH", "TCP", "UDP", "IP", "DNS", "SSL", "TLS", "VPN",
-            "OK", "NO", "YES", "ON", "OFF", "MAX", "MIN", "AVG", "SUM"
-        }
-        if text.upper() in common_codes:
+        if text.upper() in _COMMON_CODES:
             return False
-        
+
         # Translate meaningful English words
         return True
 
@@ -5,9 +5,11 @@ This module provides the abstract base class for all file processors.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import logging
+import threading
 
 from ..core.config import Config, get_global_config
 from ..translators import GoogleTranslator
@@ -213,6 +215,92 @@ class BaseProcessor(ABC):
 
         return translated
 
+    def translate_texts_concurrently(
+        self,
+        texts: List[str],
+        target_language: str = "en",
+        cancel_event: Optional[threading.Event] = None,
+    ) -> List[str]:
+        """
+        Translate a list of texts in character-bounded chunks on a thread pool.
+
+        Each chunk is translated sequentially by one pool worker, so
+        translate_workers bounds the requests in flight. Translators that
+        pack texts into multi-text requests already pool those requests, and
+        get the whole list in a single call instead.
+
+        Args:
+            texts: List of texts to translate
+            target_language: Target language code
+            cancel_event: Once set, chunks that have not started are returned
+                untranslated
+
+        Returns:
+            List of translated texts in the same order as the input
+        """
+        translate_chunk = getattr(self.translator, "translate_text_sequential", None)
+        if (
+            translate_chunk is None
+            or getattr(self.translator, "supports_batch_api", False) is True
+        ):
+            return self.translate_texts(texts, target_language)
+
+        chunk_chars = getattr(self.config.processor, "translate_chunk_chars", 4000)
+        max_workers = getattr(self.config.processor, "translate_workers", 8) or 8
+
+        # Partition texts into chunks bounded by total character count, small
+        # enough that every worker gets a chunk
+        total_chars = sum(len(text) for text in texts)
+        chunk_chars = min(chunk_chars, max(1, -(-total_chars // max_workers)))
+        chunks: List[Tuple[int, List[str]]] = []
+        start = 0
+        current: List[str] = []
+        current_chars = 0
+        for index, text in enumerate(texts):
+            if current and current_chars + len(text) > chunk_chars:
+                chunks.append((start, current))
+                start, current, current_chars = index, [], 0
+            current.append(text)
+            current_chars += len(text)
+        if current:
+            chunks.append((start, current))
+
+        # A single chunk gains nothing from the pool
+        if len(chunks) <= 1:
+            return self.translate_texts(texts, target_language)
+
+        # Set the target language once instead of from every worker
+        self.translator.target_lang = target_language
+
+        def run_chunk(chunk: List[str]) -> List[str]:
+            if cancel_event is not None and cancel_event.is_set():
+                return chunk
+            return translate_chunk(chunk)
+
+        results: Dict[int, List[str]] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            future_to_start = {
+                executor.submit(run_chunk, chunk): chunk_start
+                for chunk_start, chunk in chunks
+            }
+            for future in as_completed(future_to_start):
+                results[future_to_start[future]] = future.result()
+
+        translated: List[str] = []
+        for chunk_start, _ in chunks:
+            translated.extend(results[chunk_start])
+
+        # Update statistics from the calling thread only
+        self.stats["total_texts_translated"] += len(texts)
+        self.stats["total_chars_translated"] += total_chars
+
+        logger.debug(
+            f"Translated {len(texts)} texts in {len(chunks)} chunks "
+            f"with up to {max_workers} workers"
+        )
+
+        return translated
+
     def postprocess_translations(
         self,
         original_texts: List[str],
@@ -232,29 +320,13 @@ class BaseProcessor(ABC):
         """
         # Reconstruct full translation list
         text_to_indices = metadata.get("text_to_indices", {})
-        non_translatable_texts = metadata.get("non_translatable_texts", [])
-
-        # Create translation mapping
-        translation_map = {}
-        for i, (original, translated) in enumerate(
-            zip(
-                [text for text in original_texts if text in text_to_indices],
-                translated_texts,
-            )
-        ):
-            translation_map[original] = translated
-
-        # Map back to original structure
-        result = []
-        for original_text in original_texts:
-            if original_text in translation_map:
-                result.append(translation_map[original_text])
-            elif original_text in non_translatable_texts:
-                result.append(original_text)  # Keep original for non-translatable
-            else:
-                result.append(original_text)  # Fallback to original
 
-        return result
+        # text_to_indices is keyed by the unique texts in the order they were
+        # translated, so it lines up one-to-one with translated_texts
+        translation_map = dict(zip(text_to_indices, translated_texts))
+
+        # Map back to original structure; non-translatable texts keep the original
+        return [translation_map.get(text, text) for text in original_texts]
 
     def process_file(
         self, input_path: str, output_path: str, target_language: str = "en"
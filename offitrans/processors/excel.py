@@ -5,25 +5,49 @@ This module provides functionality to translate Excel files while preserving
 formatting, images, and layout.
 """
 
+import bisect
+import copy
+import datetime
+import functools
+import gc
+import itertools
 import os
 import logging
-from typing import List, Dict, Any, Optional
+import posixpath
+import shutil
+import sys
+import threading
+import uuid
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 try:
-    from openpyxl import load_workbook
+    from openpyxl import Workbook, load_workbook
     from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.styles.colors import Color
+    from openpyxl.cell.cell import WriteOnlyCell
     from openpyxl.cell.text import InlineFont
     from openpyxl.cell.rich_text import TextBlock, CellRichText
-    from openpyxl.utils import get_column_letter
     from openpyxl.drawing.image import Image
     from openpyxl.drawing.spreadsheet_drawing import OneCellAnchor, TwoCellAnchor
+    from openpyxl.xml import LXML as OPENPYXL_LXML
 
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+try:
+    from lxml import etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+    LXML_AVAILABLE = False
+
 try:
     from PIL import Image as PILImage
 
@@ -36,6 +60,371 @@ from ..exceptions.errors import ExcelProcessorError
 
 logger = logging.getLogger(__name__)
 
+# File extensions handled by this processor (lower case)
+EXCEL_EXTENSIONS = (".xlsx", ".xls", ".xlsm")
+
+# Workbooks with more sheets than this get an explicit GC pass between phases
+GC_SHEET_THRESHOLD = 10
+
+# Streamed translation only overlaps the openpyxl load for files at least this
+# large; on smaller workbooks the second parse and the GIL contention with the
+# load cost more than the overlap saves (measured on 5-13 KB workbooks)
+STREAMED_TRANSLATION_MIN_BYTES = 64 * 1024
+
+# SpreadsheetML namespaces used by the fast extraction path
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_SI_TAG = f"{{{SHEET_MAIN_NS}}}si"
+_T_TAG = f"{{{SHEET_MAIN_NS}}}t"
+_R_TAG = f"{{{SHEET_MAIN_NS}}}r"
+_C_TAG = f"{{{SHEET_MAIN_NS}}}c"
+_V_TAG = f"{{{SHEET_MAIN_NS}}}v"
+_F_TAG = f"{{{SHEET_MAIN_NS}}}f"
+_IS_TAG = f"{{{SHEET_MAIN_NS}}}is"
+_ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+
+
+def _extract_two_cell_anchor(anchor) -> Tuple[str, tuple]:
+    """Flatten a TwoCellAnchor into an anchor builder tuple."""
+    start, end = anchor._from, anchor.to
+    return (
+        "two_cell",
+        (
+            start.col,
+            start.colOff,
+            start.row,
+            start.rowOff,
+            end.col,
+            end.colOff,
+            end.row,
+            end.rowOff,
+        ),
+    )
+
+
+def _extract_one_cell_anchor(anchor) -> Tuple[str, tuple]:
+    """Flatten a OneCellAnchor into an anchor builder tuple."""
+    start = anchor._from
+    return (
+        "one_cell",
+        (
+            start.col,
+            start.colOff,
+            start.row,
+            start.rowOff,
+            anchor.ext.cx,
+            anchor.ext.cy,
+        ),
+    )
+
+
+def _build_two_cell_anchor(values: tuple):
+    """Create a TwoCellAnchor from anchor builder values, or None if malformed."""
+    if len(values) != 8:
+        return None
+    col, col_off, row, row_off, to_col, to_col_off, to_row, to_row_off = values
+    anchor = TwoCellAnchor()
+    anchor._from.col = col
+    anchor._from.colOff = col_off
+    anchor._from.row = row
+    anchor._from.rowOff = row_off
+    anchor.to.col = to_col
+    anchor.to.colOff = to_col_off
+    anchor.to.row = to_row
+    anchor.to.rowOff = to_row_off
+    return anchor
+
+
+def _build_one_cell_anchor(values: tuple):
+    """Create a OneCellAnchor from anchor builder values, or None if malformed."""
+    if len(values) != 6:
+        return None
+    col, col_off, row, row_off, width, height = values
+    anchor = OneCellAnchor()
+    anchor._from.col = col
+    anchor._from.colOff = col_off
+    anchor._from.row = row
+    anchor._from.rowOff = row_off
+    anchor.ext.cx = width
+    anchor.ext.cy = height
+    return anchor
+
+
+# Anchor handlers keyed by anchor class (extract) and builder type (restore)
+_ANCHOR_EXTRACTORS = (
+    {TwoCellAnchor: _extract_two_cell_anchor, OneCellAnchor: _extract_one_cell_anchor}
+    if OPENPYXL_AVAILABLE
+    else {}
+)
+_ANCHOR_BUILDERS = {
+    "two_cell": _build_two_cell_anchor,
+    "one_cell": _build_one_cell_anchor,
+}
+
+# Lower-cased family names that can render Thai script, matched as prefixes
+# so that variants such as "TH SarabunPSK Bold" count as well
+_THAI_FONT_PREFIXES = ("th sarabunpsk", "tahoma", "arial unicode ms")
+
+
+@functools.lru_cache(maxsize=512)
+def _is_thai_compatible(font_name: str) -> bool:
+    """Check whether a font name refers to a Thai-capable font."""
+    return font_name.lower().startswith(_THAI_FONT_PREFIXES)
+
+
+def _color_key(color) -> Optional[Tuple[Any, Any, Any, Any, Any]]:
+    """
+    Describe a color as an (rgb, indexed, theme, tint, auto) tuple.
+
+    Dispatches on ``color.type``: reading ``.rgb`` on theme or indexed colors
+    returns a truthy validation message instead of a value.
+
+    Args:
+        color: openpyxl Color object
+
+    Returns:
+        Hashable color key, or None for unrecognised color types
+    """
+    color_type = getattr(color, "type", None)
+    if color_type == "rgb":
+        return (color.rgb, None, None, None, None)
+    if color_type == "indexed":
+        return (None, color.indexed, None, None, None)
+    if color_type == "theme":
+        return (None, None, color.theme, color.tint, None)
+    if color_type == "auto":
+        return (None, None, None, None, color.auto)
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_color(rgb, indexed, theme, tint, auto):
+    """Return a shared Color for a ``_color_key`` tuple."""
+    if rgb is not None:
+        return Color(rgb=rgb)
+    if indexed is not None:
+        return Color(indexed=indexed)
+    if theme is not None:
+        return Color(theme=theme, tint=tint or 0.0)
+    return Color(auto=auto)
+
+
+# Style factories: cells with identical formatting share one style object.
+# Keys are sorted (name, value) tuples with colors given as ``_color_key`` tuples.
+@functools.lru_cache(maxsize=4096)
+def _make_font(key: tuple):
+    """Return the shared Font for a sorted tuple of Font keyword arguments."""
+    kwargs = dict(key)
+    if "color" in kwargs:
+        kwargs["color"] = _cached_color(*kwargs["color"])
+    return Font(**kwargs)
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_fill(fill_type: Optional[str], color: tuple):
+    """Return the shared PatternFill for a fill type and ``_color_key`` tuple."""
+    return PatternFill(fill_type=fill_type, start_color=_cached_color(*color))
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_alignment(key: tuple):
+    """Return the shared Alignment for a sorted tuple of Alignment keyword arguments."""
+    return Alignment(**dict(key))
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_points(weights: Tuple[int, ...], total: int) -> Tuple[int, ...]:
+    """
+    Compute end offsets that split ``total`` characters in proportion to ``weights``.
+
+    Offsets come from the cumulative weight, so rounding never drifts and the
+    last offset is always exactly ``total``. Results are memoized because rich
+    text cells tend to repeat the same segment layout and translated length.
+
+    Args:
+        weights: Non-negative integer weight per part
+        total: Length of the text being split
+
+    Returns:
+        End offset for each part (the start of part i is the end of part i - 1)
+    """
+    weight_sum = sum(weights)
+    if weight_sum <= 0:
+        return (total,) * len(weights)
+    return tuple(
+        cumulative * total // weight_sum for cumulative in itertools.accumulate(weights)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_inline_font(rFont, sz, b, i, u, color_key):
+    """Return a shared InlineFont for the given attributes and ``_color_key`` tuple."""
+    font_kwargs = {
+        name: value
+        for name, value in (("rFont", rFont), ("sz", sz), ("b", b), ("i", i), ("u", u))
+        if value is not None
+    }
+    if color_key is not None:
+        font_kwargs["color"] = _cached_color(*color_key)
+    return InlineFont(**font_kwargs)
+
+
+# Cell attributes that may carry rich text (checked for diagnostics only)
+_RICH_ATTRS = ("richText", "_rich_text")
+
+# Cell texts up to this length are interned (labels such as "Yes"/"No" repeat a lot)
+INTERN_MAX_LENGTH = 32
+
+# Excel's maximum column count
+MAX_EXCEL_COLUMNS = 16384
+
+
+def _column_letter(index: int) -> str:
+    """Convert a 1-based column index to its letter form."""
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+# Precomputed column letter tables (index 0 is column A)
+_COL_LETTERS = tuple(_column_letter(i) for i in range(1, MAX_EXCEL_COLUMNS + 1))
+_COL_INDEX = {letters: i for i, letters in enumerate(_COL_LETTERS, start=1)}
+
+# format_info keys copied onto Font (with their Font argument names) and Alignment
+_FONT_FORMAT_KEYS = (
+    ("font_bold", "bold"),
+    ("font_italic", "italic"),
+    ("font_underline", "underline"),
+    ("font_strike", "strike"),
+)
+_ALIGNMENT_FORMAT_KEYS = ("horizontal", "vertical", "wrap_text", "shrink_to_fit")
+
+# Hashable cell value types whose stringified length is worth memoizing
+_LENGTH_CACHEABLE = (int, float, datetime.date, datetime.time, datetime.timedelta)
+
+
+class CellRecord:
+    """
+    Lightweight record for one extracted text cell.
+
+    Uses ``__slots__`` to keep per-cell memory low on large workbooks. Dict-style
+    access (``record["text"]``, ``record.get("text")``) is kept for callers that
+    still treat extracted items as dictionaries.
+    """
+
+    __slots__ = ("text", "sheet_name", "row", "column", "format_info", "rich_text_info")
+
+    def __init__(
+        self,
+        text: str,
+        sheet_name: str,
+        row: int,
+        column: int,
+        format_info: Dict[str, Any],
+        rich_text_info: Optional[Dict[str, Any]] = None,
+    ):
+        self.text = text
+        self.sheet_name = sheet_name
+        self.row = row
+        self.column = column
+        self.format_info = format_info
+        self.rich_text_info = rich_text_info
+
+    @property
+    def cell_coordinate(self) -> str:
+        """Cell coordinate in A1 notation, derived from row and column."""
+        return f"{_COL_LETTERS[self.column - 1]}{self.row}"
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup returning ``default`` for unknown keys."""
+        return getattr(self, key, default)
+
+    def __repr__(self) -> str:
+        return (
+            f"CellRecord({self.sheet_name}!{self.cell_coordinate}, {self.text[:30]!r})"
+        )
+
+
+class FontInfo:
+    """
+    Font attributes captured for one rich text segment.
+
+    A slotted record instead of a dict; ``to_dict`` is kept for callers that
+    want the previous dictionary form.
+    """
+
+    __slots__ = (
+        "name",
+        "size",
+        "bold",
+        "italic",
+        "underline",
+        "color",
+        "color_raw",
+        "color_rgb",
+        "color_indexed",
+        "color_theme",
+        "color_tint",
+    )
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        size: Optional[float] = None,
+        bold: Optional[bool] = None,
+        italic: Optional[bool] = None,
+        underline: Optional[str] = None,
+        color: Any = None,
+        color_raw: Any = None,
+        color_rgb: Optional[str] = None,
+        color_indexed: Optional[int] = None,
+        color_theme: Optional[int] = None,
+        color_tint: Optional[float] = None,
+    ):
+        self.name = name
+        self.size = size
+        self.bold = bold
+        self.italic = italic
+        self.underline = underline
+        self.color = color
+        self.color_raw = color_raw
+        self.color_rgb = color_rgb
+        self.color_indexed = color_indexed
+        self.color_theme = color_theme
+        self.color_tint = color_tint
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the font attributes as a dictionary, omitting unset color fields."""
+        result = {
+            "name": self.name,
+            "size": self.size,
+            "bold": self.bold,
+            "italic": self.italic,
+            "underline": self.underline,
+            "color": self.color,
+        }
+        for field in (
+            "color_raw",
+            "color_rgb",
+            "color_indexed",
+            "color_theme",
+            "color_tint",
+        ):
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = value
+        return result
+
 
 class ExcelProcessor(BaseProcessor):
     """
@@ -64,14 +453,38 @@ class ExcelProcessor(BaseProcessor):
 
         super().__init__(**kwargs)
 
+        # openpyxl picks lxml up automatically; without it XML is parsed in pure Python
+        if not OPENPYXL_LXML:
+            logger.warning(
+                "lxml is not available to openpyxl; Excel files will load and save "
+                "more slowly. Install with: pip install lxml"
+            )
+
         # Excel-specific settings
         self.smart_column_width = getattr(
             self.config.processor, "smart_column_width", True
         )
+        self.fast_extract = getattr(self.config.processor, "fast_extract", True)
+        self.fast_save = getattr(self.config.processor, "fast_save", False)
 
         # Image data storage
         self.image_data: Dict[str, List[Dict[str, Any]]] = {}
 
+        # Image-occupied column intervals per worksheet as (starts, ends) arrays
+        self._image_columns: Dict[str, Tuple[List[int], List[int]]] = {}
+
+        # Extracted cell formats keyed by style id (reset for every workbook)
+        self._style_cache: Dict[int, Dict[str, Any]] = {}
+
+        # Whether each worksheet has any merged ranges (reset for every workbook)
+        self._sheet_has_merges: Dict[str, bool] = {}
+
+        # Merged ranges bucketed by row per worksheet (reset for every workbook)
+        self._merge_index: Dict[str, Dict[int, Tuple[List[int], List[tuple]]]] = {}
+
+        # Resulting style arrays keyed by (format, language, original style)
+        self._applied_styles: Dict[Tuple[int, str, tuple], Any] = {}
+
     def supports_file_type(self, file_path: str) -> bool:
         """
         Check if file type is supported.
@@ -82,8 +495,7 @@ class ExcelProcessor(BaseProcessor):
         Returns:
             True if file type is supported
         """
-        supported_extensions = {".xlsx", ".xls", ".xlsm"}
-        return Path(file_path).suffix.lower() in supported_extensions
+        return str(file_path).lower().endswith(EXCEL_EXTENSIONS)
 
     def extract_images_info(self, workbook) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -114,29 +526,11 @@ class ExcelProcessor(BaseProcessor):
                             "anchor_type": type(img.anchor).__name__,
                         }
 
-                        # Extract anchor information
-                        if isinstance(img.anchor, TwoCellAnchor):
-                            img_info["anchor_info"] = {
-                                "type": "two_cell",
-                                "from_col": img.anchor._from.col,
-                                "from_col_off": img.anchor._from.colOff,
-                                "from_row": img.anchor._from.row,
-                                "from_row_off": img.anchor._from.rowOff,
-                                "to_col": img.anchor.to.col,
-                                "to_col_off": img.anchor.to.colOff,
-                                "to_row": img.anchor.to.row,
-                                "to_row_off": img.anchor.to.rowOff,
-                            }
-                        elif isinstance(img.anchor, OneCellAnchor):
-                            img_info["anchor_info"] = {
-                                "type": "one_cell",
-                                "from_col": img.anchor._from.col,
-                                "from_col_off": img.anchor._from.colOff,
-                                "from_row": img.anchor._from.row,
-                                "from_row_off": img.anchor._from.rowOff,
-                                "width": img.anchor.ext.cx,
-                                "height": img.anchor.ext.cy,
-                            }
+                        # Extract anchor information as (type, values) so restore
+                        # can unpack it in one step
+                        extractor = _ANCHOR_EXTRACTORS.get(type(img.anchor))
+                        if extractor:
+                            img_info["anchor_builder"] = extractor(img.anchor)
 
                         sheet_images.append(img_info)
 
@@ -170,99 +564,132 @@ class ExcelProcessor(BaseProcessor):
                 else:
                     sheet._images = []
 
-                # Restore images
+                # Restore images, trying each strategy in turn
                 for img_info in sheet_images:
-                    try:
-                        img_obj = img_info["image_object"]
+                    img_obj = img_info.get("image_object")
+                    if img_obj is None:
+                        logger.warning("Image entry has no image object, skipping")
+                        continue
 
-                        # Use safe image creation method
-                        new_img = self._safe_create_image(img_obj)
-                        if new_img is None:
-                            logger.warning("Could not create image object, skipping this image")
-                            continue
+                    # Use safe image creation method
+                    new_img = self._safe_create_image(img_obj)
+                    if new_img is None:
+                        logger.warning(
+                            "Could not create image object, skipping this image"
+                        )
+                        continue
 
-                        # Restore anchor information
-                        anchor_info = img_info.get("anchor_info", {})
-                        if anchor_info.get("type") == "two_cell":
-                            # Create TwoCellAnchor
-                            anchor = TwoCellAnchor()
-                            anchor._from.col = anchor_info["from_col"]
-                            anchor._from.colOff = anchor_info["from_col_off"]
-                            anchor._from.row = anchor_info["from_row"]
-                            anchor._from.rowOff = anchor_info["from_row_off"]
-                            anchor.to.col = anchor_info["to_col"]
-                            anchor.to.colOff = anchor_info["to_col_off"]
-                            anchor.to.row = anchor_info["to_row"]
-                            anchor.to.rowOff = anchor_info["to_row_off"]
-
-                        elif anchor_info.get("type") == "one_cell":
-                            # Create OneCellAnchor
-                            anchor = OneCellAnchor()
-                            anchor._from.col = anchor_info["from_col"]
-                            anchor._from.colOff = anchor_info["from_col_off"]
-                            anchor._from.row = anchor_info["from_row"]
-                            anchor._from.rowOff = anchor_info["from_row_off"]
-                            anchor.ext.cx = anchor_info["width"]
-                            anchor.ext.cy = anchor_info["height"]
-                        else:
-                            # Use original anchor
-                            anchor = img_obj.anchor
+                    if self._try_restore_with_anchor(
+                        sheet, new_img, img_info.get("anchor_builder"), img_obj
+                    ):
+                        logger.debug(f"Successfully added image to sheet {sheet_name}")
+                    elif self._try_restore_default_anchor(sheet, new_img):
+                        logger.debug("Successfully added image using default anchor")
+                    elif self._try_restore_original(sheet, img_obj):
+                        logger.debug("Successfully used original image object")
+                    else:
+                        logger.error("All image restoration methods failed")
+                        logger.info("Skipping this image, continuing with others")
 
-                        new_img.anchor = anchor
-                        try:
-                            sheet.add_image(new_img)
-                            logger.debug(f"Successfully added image to sheet {sheet_name}")
-                        except Exception as add_err:
-                            logger.warning(f"Adding image to sheet failed: {add_err}")
-                            # Try using default anchor to re-add
-                            try:
-                                default_anchor = OneCellAnchor()
-                                new_img.anchor = default_anchor
-                                sheet.add_image(new_img)
-                                logger.debug("Successfully added image using default anchor")
-                            except Exception as default_err:
-                                logger.error(f"Using default anchor also failed: {default_err}")
-                                continue
+        except Exception as e:
+            logger.error(f"Error restoring images: {e}")
 
-                    except Exception as e:
-                        logger.error(f"Error restoring image: {e}")
-                        # If unable to restore anchor, try alternative approach
-                        try:
-                            logger.debug("Trying to use original image object...")
-                            # Check original image object status
-                            if hasattr(img_obj, "anchor") and img_obj.anchor:
-                                sheet.add_image(img_obj)
-                                logger.debug("Successfully used original image object")
-                            else:
-                                # Create a simple default anchor
-                                default_anchor = OneCellAnchor()
-                                default_anchor._from.col = 0
-                                default_anchor._from.row = 0
-                                default_anchor._from.colOff = 0
-                                default_anchor._from.rowOff = 0
-
-                                # Set default size
-                                default_anchor.ext.cx = 2000000  # Default width
-                                default_anchor.ext.cy = 2000000  # Default height
-
-                                img_obj.anchor = default_anchor
-                                sheet.add_image(img_obj)
-                                logger.debug("Successfully used default anchor")
-                        except Exception as fallback_err:
-                            logger.error(f"All image restoration methods failed: {fallback_err}")
-                            logger.info("Skipping this image, continuing with others")
-                            continue
+    @staticmethod
+    def _add_image(sheet, img) -> bool:
+        """
+        Add an image to a worksheet.
+
+        Args:
+            sheet: openpyxl worksheet
+            img: Image with its anchor already set
 
+        Returns:
+            True if the image was added, False otherwise
+        """
+        try:
+            sheet.add_image(img)
+            return True
         except Exception as e:
-            logger.error(f"Error restoring images: {e}")
-    
+            logger.warning(f"Adding image to sheet failed: {e}")
+            return False
+
+    def _try_restore_with_anchor(
+        self, sheet, img, anchor_builder: Optional[Tuple[str, tuple]], img_obj
+    ) -> bool:
+        """
+        Add an image using the anchor recorded at extraction time.
+
+        Args:
+            sheet: openpyxl worksheet
+            img: Newly created image
+            anchor_builder: (anchor type, anchor values) from ``extract_images_info``
+            img_obj: Original image object (its anchor is used for unknown types)
+
+        Returns:
+            True if the image was added, False otherwise
+        """
+        if not anchor_builder:
+            # Use original anchor
+            anchor = getattr(img_obj, "anchor", None)
+        else:
+            anchor_type, values = anchor_builder
+            builder = _ANCHOR_BUILDERS.get(anchor_type)
+            anchor = builder(values) if builder else None
+
+        if anchor is None:
+            return False
+
+        img.anchor = anchor
+        return self._add_image(sheet, img)
+
+    def _try_restore_default_anchor(self, sheet, img) -> bool:
+        """
+        Add an image with a default one-cell anchor.
+
+        Args:
+            sheet: openpyxl worksheet
+            img: Newly created image
+
+        Returns:
+            True if the image was added, False otherwise
+        """
+        img.anchor = OneCellAnchor()
+        return self._add_image(sheet, img)
+
+    def _try_restore_original(self, sheet, img_obj) -> bool:
+        """
+        Add the original image object, anchoring it at A1 if it has no anchor.
+
+        Args:
+            sheet: openpyxl worksheet
+            img_obj: Original image object
+
+        Returns:
+            True if the image was added, False otherwise
+        """
+        if not getattr(img_obj, "anchor", None):
+            # Create a simple default anchor
+            default_anchor = OneCellAnchor()
+            default_anchor._from.col = 0
+            default_anchor._from.row = 0
+            default_anchor._from.colOff = 0
+            default_anchor._from.rowOff = 0
+
+            # Set default size
+            default_anchor.ext.cx = 2000000  # Default width
+            default_anchor.ext.cy = 2000000  # Default height
+
+            img_obj.anchor = default_anchor
+
+        return self._add_image(sheet, img_obj)
+
     def _safe_create_image(self, img_obj) -> Optional[Image]:
         """
         Safely create image object, handling various possible errors.
-        
+
         Args:
             img_obj: Original image object
-            
+
         Returns:
             New image object or None
         """
@@ -271,7 +698,7 @@ class ExcelProcessor(BaseProcessor):
             if hasattr(img_obj, "anchor"):
                 logger.debug("Using original image object (recommended method)")
                 return img_obj
-            
+
             # Method 2: Try using _data() method
             if hasattr(img_obj, "_data"):
                 try:
@@ -280,15 +707,16 @@ class ExcelProcessor(BaseProcessor):
                         # Check and clean data
                         if isinstance(img_data, bytes):
                             # Remove null bytes
-                            if b'\x00' in img_data:
+                            if b"\x00" in img_data:
                                 logger.debug("Detected null bytes, cleaning...")
-                                img_data = img_data.replace(b'\x00', b'')
-                            
+                                img_data = img_data.replace(b"\x00", b"")
+
                             # Validate image data (if PIL available)
                             if PIL_AVAILABLE:
                                 try:
                                     # Use PIL to validate image data
                                     import io
+
                                     test_img = PILImage.open(io.BytesIO(img_data))
                                     test_img.verify()
                                     logger.debug("Image data validation successful")
@@ -297,19 +725,24 @@ class ExcelProcessor(BaseProcessor):
                                     # Continue trying to use data
                             else:
                                 logger.debug("Skipping PIL validation (not installed)")
-                            
+
                             # Create new openpyxl image object
                             try:
                                 new_img = Image(img_data)
-                                logger.debug("Successfully created image using cleaned data")
+                                logger.debug(
+                                    "Successfully created image using cleaned data"
+                                )
                                 return new_img
                             except Exception as create_err:
-                                logger.debug(f"Failed to create image using cleaned data: {create_err}")
+                                logger.debug(
+                                    "Failed to create image using cleaned data: "
+                                    f"{create_err}"
+                                )
                                 pass
-                        
+
                 except Exception as data_err:
                     logger.debug(f"Failed to get image data: {data_err}")
-            
+
             # Method 3: Try using other attributes
             if hasattr(img_obj, "ref"):
                 try:
@@ -318,16 +751,16 @@ class ExcelProcessor(BaseProcessor):
                     return img_obj
                 except Exception:
                     pass
-            
+
             # If all methods fail, return original object
             logger.debug("All methods failed, returning original object")
             return img_obj
-            
+
         except Exception as e:
             logger.error(f"Image object creation completely failed: {e}")
             return None
 
-    def extract_text(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_text(self, file_path: str) -> List[CellRecord]:
         """
         Extract text content from Excel file.
 
@@ -335,9 +768,197 @@ class ExcelProcessor(BaseProcessor):
             file_path: Path to the Excel file
 
         Returns:
-            List of dictionaries containing text and metadata
+            List of CellRecord entries containing text and metadata
+        """
+        if self.fast_extract:
+            text_data = self._fast_extract_text(file_path)
+            if text_data is not None:
+                return text_data
+
+        workbook, text_data = self._load_and_extract(file_path)
+        workbook.close()
+        return text_data
+
+    def _fast_extract_text(self, file_path: str) -> Optional[List[CellRecord]]:
+        """
+        Extract text by streaming the workbook XML instead of loading it with openpyxl.
+
+        Only the text and cell positions are read; ``format_info`` is left empty
+        and image information is not collected. Returns None when the workbook
+        cannot be handled here (rich text runs, cells without references, or
+        an unexpected package layout) so the caller can fall back to openpyxl.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            List of CellRecord entries, or None to request the openpyxl path
+        """
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                sheet_paths, shared_strings_path = self._read_workbook_parts(archive)
+
+                shared_strings: List[str] = []
+                rich_indexes = set()
+                if shared_strings_path and shared_strings_path in archive.namelist():
+                    with archive.open(shared_strings_path) as source:
+                        for _, element in etree.iterparse(source, events=("end",)):
+                            if element.tag != _SI_TAG:
+                                continue
+                            if element.find(_R_TAG) is not None:
+                                rich_indexes.add(len(shared_strings))
+                            text = self._inline_text(element).replace("x005F_", "")
+                            shared_strings.append(text)
+                            element.clear()
+
+                text_data = []
+                for sheet_name, sheet_path in sheet_paths:
+                    sheet_name = sys.intern(sheet_name)
+                    with archive.open(sheet_path) as source:
+                        for _, element in etree.iterparse(source, events=("end",)):
+                            tag = element.tag
+                            if tag == _ROW_TAG:
+                                element.clear()
+                                continue
+                            if tag != _C_TAG:
+                                continue
+
+                            data_type = element.get("t", "n")
+                            if data_type not in ("s", "str", "inlineStr"):
+                                continue
+                            if element.find(_F_TAG) is not None:
+                                continue
+
+                            if data_type == "s":
+                                index = int(element.findtext(_V_TAG, "-1"))
+                                if index in rich_indexes:
+                                    logger.debug(
+                                        "Rich shared string found, using openpyxl path"
+                                    )
+                                    return None
+                                value = shared_strings[index] if index >= 0 else None
+                            elif data_type == "str":
+                                value = element.findtext(_V_TAG, None)
+                            else:
+                                inline = element.find(_IS_TAG)
+                                if (
+                                    inline is not None
+                                    and inline.find(_R_TAG) is not None
+                                ):
+                                    logger.debug(
+                                        "Rich inline string found, using openpyxl path"
+                                    )
+                                    return None
+                                value = (
+                                    self._inline_text(inline)
+                                    if inline is not None
+                                    else None
+                                )
+
+                            if not value or value[0] == "=" or value.isspace():
+                                continue
+
+                            ref = element.get("r")
+                            if not ref:
+                                return None
+                            if len(value) <= INTERN_MAX_LENGTH:
+                                value = sys.intern(value)
+                            letters = ref.rstrip("0123456789")
+                            text_data.append(
+                                CellRecord(
+                                    value,
+                                    sheet_name,
+                                    int(ref[len(letters) :]),
+                                    _COL_INDEX[letters],
+                                    {},
+                                    None,
+                                )
+                            )
+
+            logger.info(
+                f"Fast path extracted {len(text_data)} text cells from {file_path}"
+            )
+            return text_data
+
+        except Exception as e:
+            logger.debug(f"Fast extraction unavailable for {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def _read_workbook_parts(archive) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        Resolve worksheet part paths and the shared string table from the package.
+
+        Args:
+            archive: Open XLSX zip archive
+
+        Returns:
+            Tuple of ([(sheet_name, part_path), ...], shared strings part path)
+        """
+        targets = {}
+        shared_strings_path = None
+        rels = etree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+        for rel in rels.iter(f"{{{PKG_REL_NS}}}Relationship"):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                path = target.lstrip("/")
+            else:
+                path = posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = path
+            if rel.get("Type", "").endswith("/sharedStrings"):
+                shared_strings_path = path
+
+        sheet_paths = []
+        workbook = etree.fromstring(archive.read("xl/workbook.xml"))
+        for sheet in workbook.iter(f"{{{SHEET_MAIN_NS}}}sheet"):
+            path = targets.get(sheet.get(f"{{{DOC_REL_NS}}}id"))
+            # Chartsheets and other non-worksheet parts carry no cell text
+            if path and "/worksheets/" in path:
+                sheet_paths.append((sheet.get("name"), path))
+
+        return sheet_paths, shared_strings_path
+
+    @staticmethod
+    def _inline_text(element) -> str:
+        """
+        Concatenate the plain text of a string item, ignoring phonetic runs.
+
+        Args:
+            element: ``si`` or ``is`` element
+
+        Returns:
+            Text content of the string item
+        """
+        parts = []
+        plain = element.find(_T_TAG)
+        if plain is not None and plain.text:
+            parts.append(plain.text)
+        for run in element.findall(_R_TAG):
+            run_text = run.findtext(_T_TAG)
+            if run_text:
+                parts.append(run_text)
+        return "".join(parts)
+
+    def _load_and_extract(self, file_path: str) -> Tuple[Any, List[CellRecord]]:
+        """
+        Open an Excel file and extract its text, keeping the workbook open.
+
+        The returned workbook can be handed straight to
+        ``_replace_text_with_format_and_images`` so the file is only parsed once.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            Tuple of (openpyxl workbook, text data list)
         """
         text_data = []
+        self._style_cache = {}
+        self._sheet_has_merges = {}
+        self._merge_index = {}
+        self._applied_styles = {}
+        self._image_columns = {}
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         try:
             workbook = load_workbook(file_path, data_only=False)
@@ -347,62 +968,68 @@ class ExcelProcessor(BaseProcessor):
             if self.image_protection:
                 logger.info("Extracting image information...")
                 self.image_data = self.extract_images_info(workbook)
+                self._image_columns = {
+                    name: self._image_column_intervals(images)
+                    for name, images in self.image_data.items()
+                    if images
+                }
 
             for sheet_name in workbook.sheetnames:
                 sheet = workbook[sheet_name]
+                sheet_name = sys.intern(sheet_name)
                 logger.info(f"Processing worksheet: {sheet_name}")
+                self._sheet_has_merges[sheet_name] = bool(sheet.merged_cells.ranges)
+
+                # Iterate through the cells the sheet actually stores, in file
+                # (row-major) order; iter_rows() would create every empty
+                # cell of the grid. Extraction only reads cells, so the dict
+                # is walked directly rather than copied first
+                for cell in sheet._cells.values():
+                    # Only string cells can hold translatable text; formulas,
+                    # numbers, dates and empty cells are pruned by type
+                    # before their value is touched
+                    if cell.data_type not in ("s", "str"):
+                        continue
 
-                # Iterate through all cells
-                for row in sheet.iter_rows():
-                    for cell in row:
-                        if (
-                            cell.value
-                            and isinstance(cell.value, str)
-                            and cell.value.strip()
-                        ):
-                            # Skip formula cells (starting with =)
-                            if not cell.value.startswith("="):
-                                # Extract cell format information
-                                format_info = self._extract_cell_format(cell)
-
-                                # Check for rich text formatting
-                                rich_text_info = self._extract_rich_text_format(cell)
-
-                                text_data.append(
-                                    {
-                                        "text": cell.value,
-                                        "sheet_name": sheet_name,
-                                        "row": cell.row,
-                                        "column": cell.column,
-                                        "cell_coordinate": cell.coordinate,
-                                        "format_info": format_info,
-                                        "rich_text_info": rich_text_info,
-                                    }
-                                )
+                    # Keep non-empty, non-blank plain strings, skipping formula-like
+                    # text (starting with =); isspace() avoids building a stripped copy
+                    value = cell.value
+                    if (
+                        type(value) is not str
+                        or not value
+                        or value[0] == "="
+                        or value.isspace()
+                    ):
+                        continue
 
-                                logger.debug(
-                                    f"Extracted text from {sheet_name}!{cell.coordinate}: '{cell.value[:50]}...'"
-                                )
-                                
-                                # Special attention to row 78 columns M-Q (referenced in original code)
-                                if cell.row == 78 and cell.column >= 13 and cell.column <= 17:  # M=13, Q=17
-                                    logger.info(f"Special attention: Row 78 M-Q column {cell.coordinate}")
-                                    logger.info(f"  Text content: '{cell.value}'")
-                                    logger.info(f"  Rich text info: {rich_text_info}")
-                                    
-                                    # Detailed check of this cell
-                                    logger.info(f"  Raw content check:")
-                                    logger.info(f"    cell.value: {type(cell.value)} = {cell.value}")
-                                    logger.info(f"    cell._value: {type(cell._value) if hasattr(cell, '_value') else 'None'}")
-                                    
-                                    # Check merged cell
-                                    merged_info = self._check_merged_cell(cell)
-                                    if merged_info:
-                                        logger.info(f"  Merged cell info: {merged_info}")
+                    if len(value) <= INTERN_MAX_LENGTH:
+                        value = sys.intern(value)
+
+                    # Extract cell format information
+                    format_info = self._extract_cell_format(cell)
+
+                    # Check for rich text formatting
+                    rich_text_info = self._extract_rich_text_format(cell)
+
+                    text_data.append(
+                        CellRecord(
+                            value,
+                            sheet_name,
+                            cell.row,
+                            cell.column,
+                            format_info,
+                            rich_text_info,
+                        )
+                    )
+
+                    if debug_enabled:
+                        logger.debug(
+                            f"Extracted text from {sheet_name}!{cell.coordinate}: "
+                            f"'{value[:50]}...'"
+                        )
 
-            workbook.close()
             logger.info(f"Total extracted {len(text_data)} text cells")
-            return text_data
+            return workbook, text_data
 
         except Exception as e:
             raise ExcelProcessorError(
@@ -425,29 +1052,90 @@ class ExcelProcessor(BaseProcessor):
         Returns:
             True if successful, False otherwise
         """
+        executor = None
+        future = None
+        cancel = threading.Event()
         try:
-            # Step 1: Extract text and metadata
+            # Start translating the streamed texts early so the network round
+            # trips overlap with the full openpyxl load below
+            pending = None
+            if (
+                self.fast_extract
+                and os.path.getsize(file_path) >= STREAMED_TRANSLATION_MIN_BYTES
+            ):
+                streamed = self._fast_extract_text(file_path)
+                if streamed:
+                    logger.info(
+                        "Translating streamed texts while loading the workbook..."
+                    )
+                    streamed_texts = [item.text for item in streamed]
+                    streamed_unique, streamed_metadata = self.preprocess_texts(
+                        streamed_texts
+                    )
+                    executor = ThreadPoolExecutor(max_workers=1)
+                    future = executor.submit(
+                        self.translate_texts_concurrently,
+                        streamed_unique,
+                        target_language,
+                        cancel,
+                    )
+                    pending = (streamed_texts, streamed_unique, streamed_metadata)
+                streamed = None
+
+            # Step 1: Extract text and metadata (the workbook stays open)
             logger.info("Step 1: Extracting text from Excel file...")
-            text_data = self.extract_text(file_path)
+            workbook, text_data = self._load_and_extract(file_path)
 
             if not text_data:
                 logger.warning("No translatable text found in Excel file")
+                workbook.close()
                 return False
 
             # Step 2: Preprocess and translate texts
             logger.info("Step 2: Translating texts...")
-            original_texts = [item["text"] for item in text_data]
-            unique_texts, metadata = self.preprocess_texts(original_texts)
-            translated_unique = self.translate_texts(unique_texts, target_language)
+            original_texts = [item.text for item in text_data]
+            if pending is not None and pending[0] == original_texts:
+                _, unique_texts, metadata = pending
+                translated_unique = future.result()
+            else:
+                unique_texts, metadata = self.preprocess_texts(original_texts)
+                known: Dict[str, str] = {}
+                if pending is not None:
+                    # Keep what the streamed pass already translated and only
+                    # send the texts it did not see
+                    logger.debug(
+                        "Streamed texts differ from the loaded workbook, "
+                        "translating the missing ones"
+                    )
+                    known = dict(zip(pending[1], future.result()))
+                missing = [text for text in unique_texts if text not in known]
+                if missing:
+                    known.update(
+                        zip(
+                            missing,
+                            self.translate_texts_concurrently(missing, target_language),
+                        )
+                    )
+                translated_unique = [known[text] for text in unique_texts]
             translated_texts = self.postprocess_translations(
                 original_texts, translated_unique, metadata
             )
+            del pending, original_texts, unique_texts, translated_unique, metadata
 
-            # Step 3: Apply translations to Excel file
+            # Release translation temporaries before the write pass on big workbooks
+            if len(workbook.sheetnames) > GC_SHEET_THRESHOLD:
+                gc.collect()
+
+            # Step 3: Apply translations to the already loaded workbook
             logger.info("Step 3: Applying translations to Excel file...")
-            success = self._replace_text_with_format_and_images(
-                file_path, output_path, text_data, translated_texts, target_language
-            )
+            if self.fast_save:
+                success = self._fast_save_workbook(
+                    workbook, output_path, text_data, translated_texts
+                )
+            else:
+                success = self._replace_text_with_format_and_images(
+                    workbook, output_path, text_data, translated_texts, target_language
+                )
 
             if success:
                 logger.info(f"Successfully translated Excel file: {output_path}")
@@ -460,11 +1148,138 @@ class ExcelProcessor(BaseProcessor):
             logger.error(f"Error translating Excel file: {e}")
             return False
 
+        finally:
+            # After an early return or an error, stop the streamed translation
+            # without waiting: cancel it if it has not started, else have it
+            # skip the chunks it has not reached yet
+            if executor is not None:
+                cancel.set()
+                future.cancel()
+                executor.shutdown(wait=False)
+
+    def _save_workbook_atomically(self, workbook, output_path: str) -> None:
+        """
+        Save a workbook to a temporary file next to the output, then rename it.
+
+        The output path is only replaced once the archive has been fully
+        written, so a failed save never leaves a truncated file behind.
+
+        Args:
+            workbook: openpyxl workbook to save
+            output_path: Final path for the Excel file
+        """
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        suffix = Path(output_path).suffix or ".xlsx"
+
+        # Create the temporary file with the usual 0o666 mode so the kernel
+        # applies the umask, as it would for a directly written output
+        while True:
+            temp_path = os.path.join(output_dir, f"tmp{uuid.uuid4().hex}{suffix}")
+            try:
+                fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            except FileExistsError:
+                continue
+            os.close(fd)
+            break
+
+        try:
+            workbook.save(temp_path)
+            # Keep the permissions of the file being replaced
+            if os.path.exists(output_path):
+                shutil.copymode(output_path, temp_path)
+            os.replace(temp_path, output_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _fast_save_workbook(
+        self,
+        workbook,
+        output_path: str,
+        text_data: List[CellRecord],
+        translated_texts: List[str],
+    ) -> bool:
+        """
+        Stream translated values into a new write-only workbook.
+
+        Cell values, cell styles and column widths are carried over. Rich text,
+        merged ranges and images are not preserved, which keeps memory use
+        flat on large workbooks. Each distinct source style is copied into the
+        output workbook once and reused for every cell that shares it.
+
+        Args:
+            workbook: Source openpyxl workbook (closed by this method)
+            output_path: Path for output Excel file
+            text_data: Original text data with metadata
+            translated_texts: List of translated texts
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            translations: Dict[str, Dict[Tuple[int, int], str]] = defaultdict(dict)
+            for item, translated_text in zip(text_data, translated_texts):
+                translations[item.sheet_name][(item.row, item.column)] = translated_text
+
+            out_workbook = Workbook(write_only=True)
+
+            # Output style arrays keyed by the source cell's style array
+            style_templates: Dict[tuple, Any] = {}
+
+            for sheet in workbook.worksheets:
+                out_sheet = out_workbook.create_sheet(sheet.title)
+
+                # Column widths must be set before any rows are written
+                for letter, dimension in sheet.column_dimensions.items():
+                    if dimension.width:
+                        out_sheet.column_dimensions[letter].width = dimension.width
+
+                sheet_translations = translations.get(sheet.title, {})
+                for row in sheet.iter_rows():
+                    values = []
+                    for cell in row:
+                        value = cell.value
+                        if sheet_translations:
+                            value = sheet_translations.get(
+                                (cell.row, cell.column), value
+                            )
+
+                        if not cell.has_style:
+                            values.append(value)
+                            continue
+
+                        out_cell = WriteOnlyCell(out_sheet, value=value)
+                        style_key = tuple(cell._style)
+                        template = style_templates.get(style_key)
+                        if template is None:
+                            out_cell.font = copy.copy(cell.font)
+                            out_cell.fill = copy.copy(cell.fill)
+                            out_cell.border = copy.copy(cell.border)
+                            out_cell.alignment = copy.copy(cell.alignment)
+                            out_cell.protection = copy.copy(cell.protection)
+                            out_cell.number_format = cell.number_format
+                            style_templates[style_key] = copy.copy(out_cell._style)
+                        else:
+                            out_cell._style = copy.copy(template)
+                        values.append(out_cell)
+                    out_sheet.append(values)
+
+            self._save_workbook_atomically(out_workbook, output_path)
+            workbook.close()
+
+            logger.info(f"Saved Excel file in fast mode: {output_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving Excel file in fast mode: {e}")
+            return False
+
     def _replace_text_with_format_and_images(
         self,
-        excel_path: str,
+        workbook,
         output_path: str,
-        text_data: List[Dict[str, Any]],
+        text_data: List[CellRecord],
         translated_texts: List[str],
         target_language: str = "en",
     ) -> bool:
@@ -472,7 +1287,7 @@ class ExcelProcessor(BaseProcessor):
         Replace text in Excel file while preserving formatting and images.
 
         Args:
-            excel_path: Input Excel file path
+            workbook: openpyxl workbook the text data was extracted from
             output_path: Output Excel file path
             text_data: Original text data with metadata
             translated_texts: List of translated texts
@@ -482,64 +1297,51 @@ class ExcelProcessor(BaseProcessor):
             True if successful, False otherwise
         """
         try:
-            workbook = load_workbook(excel_path, data_only=False)
-
-            # Replace text in cells
+            # Group writes by worksheet so each sheet is resolved only once
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            writes_by_sheet = defaultdict(list)
             for item, translated_text in zip(text_data, translated_texts):
-                sheet_name = item["sheet_name"]
-                row = item["row"]
-                column = item["column"]
-                format_info = item["format_info"]
+                writes_by_sheet[item.sheet_name].append((item, translated_text))
 
-                # Get worksheet and cell
+            # Replace text in cells
+            for sheet_name, writes in writes_by_sheet.items():
                 sheet = workbook[sheet_name]
-                cell = sheet.cell(row=row, column=column)
-
-                # Replace text
-                cell.value = translated_text
-
-                # Apply formatting
-                self._apply_cell_format(cell, format_info, target_language)
-
-                # Apply rich text formatting if available
-                rich_text_info = item.get("rich_text_info")
-                if rich_text_info and rich_text_info.get("has_rich_text"):
-                    self._apply_rich_text_format(
-                        cell,
-                        item["text"],
-                        translated_text,
-                        rich_text_info,
-                        target_language,
-                    )
+                sheet_cells = sheet._cells
 
-                # Handle merged cell synchronization
-                merged_cell_info = self._check_merged_cell(cell)
-                if merged_cell_info:
-                    logger.debug(f"Processing merged cell: {merged_cell_info['range']}")
-                    self._synchronize_merged_cell_formats(cell, item["text"], translated_text, format_info, rich_text_info, merged_cell_info)
-                
-                # Special processing for row 78 M-Q columns (compatibility with reference code)
-                if cell.row == 78 and cell.column >= 13 and cell.column <= 17:  # M=13, Q=17
-                    logger.info(f"Special attention row 78 {cell.coordinate}")
-                    logger.info(f"  Translation before: '{item['text']}'")
-                    logger.info(f"  Translation after: '{translated_text}'")
-                    logger.info(f"  Rich text info: {rich_text_info}")
-                    
-                    # If no rich text detected but may exist, try forced recheck
-                    if not rich_text_info:
-                        logger.info(f"  Forced rich text recheck...")
-                        rich_text_info = self._extract_rich_text_format(cell)
-                        if rich_text_info:
-                            logger.info(f"  Recheck found rich text: {rich_text_info}")
-                            self._apply_rich_text_format(
-                                cell, item["text"], translated_text, rich_text_info, target_language
-                            )
-                            
-                            # If found rich text and is merged cell, re-synchronize
-                            if merged_cell_info:
-                                self._synchronize_merged_cell_formats(cell, item["text"], translated_text, format_info, rich_text_info, merged_cell_info)
-                
-                logger.debug(f"Applied translation to {sheet_name}!{cell.coordinate}")
+                # Visit cells in storage order
+                writes.sort(key=lambda write: (write[0].row, write[0].column))
+
+                for item, translated_text in writes:
+                    row = item.row
+                    column = item.column
+                    format_info = item.format_info
+
+                    # Cells were extracted from this workbook, so they already exist
+                    cell = sheet_cells.get((row, column))
+                    if cell is None:
+                        cell = sheet.cell(row=row, column=column)
+
+                    # Replace text
+                    cell.value = translated_text
+
+                    # Apply formatting
+                    self._apply_cell_format(cell, format_info, target_language)
+
+                    # Apply rich text formatting if available
+                    rich_text_info = item.rich_text_info
+                    if rich_text_info and rich_text_info.get("has_rich_text"):
+                        self._apply_rich_text_format(
+                            cell,
+                            item.text,
+                            translated_text,
+                            rich_text_info,
+                            target_language,
+                        )
+
+                    if debug_enabled:
+                        logger.debug(
+                            f"Applied translation to {sheet_name}!{cell.coordinate}"
+                        )
 
             # Restore images if image protection is enabled
             if self.image_protection and self.image_data:
@@ -552,7 +1354,7 @@ class ExcelProcessor(BaseProcessor):
                 self._smart_adjust_column_width(workbook)
 
             # Save the workbook
-            workbook.save(output_path)
+            self._save_workbook_atomically(workbook, output_path)
             workbook.close()
 
             logger.info(f"Successfully saved translated Excel file: {output_path}")
@@ -566,62 +1368,59 @@ class ExcelProcessor(BaseProcessor):
         """
         Extract formatting information from a cell.
 
+        Only primitive values are stored so the result does not keep openpyxl
+        style objects alive. Results are cached per style record, which means
+        cells sharing a style share the same dictionary; treat it as read-only.
+
         Args:
             cell: openpyxl cell object
 
         Returns:
             Dictionary containing format information
         """
+        style_id = cell.style_id
+        cached = self._style_cache.get(style_id)
+        if cached is not None:
+            return cached
+
         format_info = {}
 
         try:
+            # Resolve each style proxy once
+            font = cell.font
+            fill = cell.fill
+            alignment = cell.alignment
+
             # Font information
-            if cell.font:
-                format_info["font_name"] = cell.font.name
-                format_info["font_size"] = cell.font.size
-                format_info["font_bold"] = cell.font.bold
-                format_info["font_italic"] = cell.font.italic
-                format_info["font_underline"] = cell.font.underline
-                format_info["font_strike"] = cell.font.strike
-
-                # Color information
-                if cell.font.color:
-                    format_info["font_color"] = cell.font.color
-                    if hasattr(cell.font.color, "rgb") and cell.font.color.rgb:
-                        format_info["font_color_rgb"] = cell.font.color.rgb
-                    elif (
-                        hasattr(cell.font.color, "indexed")
-                        and cell.font.color.indexed is not None
-                    ):
-                        format_info["font_color_indexed"] = cell.font.color.indexed
-                    elif (
-                        hasattr(cell.font.color, "theme")
-                        and cell.font.color.theme is not None
-                    ):
-                        format_info["font_color_theme"] = cell.font.color.theme
-                        if (
-                            hasattr(cell.font.color, "tint")
-                            and cell.font.color.tint is not None
-                        ):
-                            format_info["font_color_tint"] = cell.font.color.tint
+            if font:
+                format_info["font_name"] = font.name
+                format_info["font_size"] = font.size
+                format_info["font_bold"] = font.bold
+                format_info["font_italic"] = font.italic
+                format_info["font_underline"] = font.underline
+                format_info["font_strike"] = font.strike
+
+                # Color information as a hashable (rgb, indexed, theme, tint, auto) key
+                color = font.color
+                if color is not None:
+                    format_info["font_color"] = _color_key(color)
 
             # Fill information
-            if cell.fill and hasattr(cell.fill, "start_color"):
-                format_info["fill_color"] = cell.fill.start_color
-                format_info["fill_type"] = cell.fill.fill_type
-                format_info["fill_object"] = cell.fill
+            start_color = getattr(fill, "start_color", None)
+            if start_color is not None:
+                format_info["fill_type"] = fill.fill_type
+                format_info["fill_color"] = _color_key(start_color)
 
             # Alignment information
-            if cell.alignment:
-                format_info["horizontal"] = cell.alignment.horizontal
-                format_info["vertical"] = cell.alignment.vertical
-                format_info["wrap_text"] = cell.alignment.wrap_text
-                format_info["shrink_to_fit"] = cell.alignment.shrink_to_fit
+            if alignment:
+                format_info["horizontal"] = alignment.horizontal
+                format_info["vertical"] = alignment.vertical
+                format_info["wrap_text"] = alignment.wrap_text
+                format_info["shrink_to_fit"] = alignment.shrink_to_fit
 
             # Border information
             if cell.border:
                 format_info["has_border"] = True
-                format_info["border"] = cell.border
 
             # Number format
             if cell.number_format:
@@ -630,6 +1429,7 @@ class ExcelProcessor(BaseProcessor):
         except Exception as e:
             logger.error(f"Error extracting cell format: {e}")
 
+        self._style_cache[style_id] = format_info
         return format_info
 
     def _extract_rich_text_format(self, cell) -> Optional[Dict[str, Any]]:
@@ -643,87 +1443,80 @@ class ExcelProcessor(BaseProcessor):
             Rich text format information or None
         """
         try:
-            # Enhanced debugging information
-            cell_text = str(cell.value) if cell.value else ""
-            logger.debug(f"Checking cell {cell.coordinate}: '{cell_text[:30]}...'")
-            logger.debug(f"Cell type: {type(cell.value)}")
-            logger.debug(f"_value type: {type(cell._value) if hasattr(cell, '_value') else 'None'}")
-            
-            # Check merged cell status
-            merged_info = None
-            if hasattr(cell, 'coordinate'):
-                worksheet = cell.parent
-                if worksheet and hasattr(worksheet, 'merged_cells'):
-                    for merged_range in worksheet.merged_cells.ranges:
-                        if cell.coordinate in merged_range:
-                            logger.debug(f"Detected merged cell: {merged_range}")
-                            merged_info = {
-                                'range': str(merged_range),
-                                'top_left': merged_range.coord.split(':')[0]
-                            }
-                            break
-            
-            # Method 1: Check _value attribute
-            if hasattr(cell, '_value') and isinstance(cell._value, CellRichText):
-                logger.debug(f"Found rich text in _value")
-                rich_text = cell._value
-                return self._parse_rich_text_object(rich_text, cell.coordinate, merged_info)
-            
-            # Method 2: Check value attribute
-            if isinstance(cell.value, CellRichText):
-                logger.debug(f"Found rich text in value")
-                rich_text = cell.value
-                return self._parse_rich_text_object(rich_text, cell.coordinate, merged_info)
-            
-            # Method 3: For merged cells, check the range's first cell
-            if merged_info:
-                try:
-                    worksheet = cell.parent
-                    top_left_cell = worksheet[merged_info['top_left']]
-                    
-                    # Check merged cell's main cell for rich text
-                    if hasattr(top_left_cell, '_value') and isinstance(top_left_cell._value, CellRichText):
-                        logger.debug(f"Found rich text in merged cell main cell")
-                        rich_text = top_left_cell._value
-                        return self._parse_rich_text_object(rich_text, cell.coordinate, merged_info)
-                    elif isinstance(top_left_cell.value, CellRichText):
-                        logger.debug(f"Found rich text in merged cell main cell value")
-                        rich_text = top_left_cell.value
-                        return self._parse_rich_text_object(rich_text, cell.coordinate, merged_info)
-                except Exception as merged_err:
-                    logger.debug(f"Error checking merged cell main cell: {merged_err}")
-            
-            # Method 4: Check for rich text attributes
-            if hasattr(cell, 'richText') and cell.richText:
-                logger.debug(f"Found traditional richText format")
-                # Handle traditional richText format if needed
-                return None
-            
-            # Method 5: Check raw data structure
-            if hasattr(cell, '_value') and hasattr(cell._value, '__dict__'):
-                logger.debug(f"_value attributes: {cell._value.__dict__}")
-            
-            # Method 6: Check all attributes for rich text
-            rich_attrs = [attr for attr in dir(cell) if 'rich' in attr.lower()]
-            if rich_attrs:
-                logger.debug(f"Found rich text related attributes: {rich_attrs}")
-                for attr in rich_attrs:
+            # Fast path: rich text lives in the cell's own value
+            value = getattr(cell, "_value", None)
+            if isinstance(value, CellRichText):
+                logger.debug("Found rich text in _value")
+                return self._parse_rich_text_object(
+                    value, cell.coordinate, self._merged_rich_text_info(cell)
+                )
+
+            # Merged cells may carry rich text in the range's top-left cell
+            worksheet = getattr(cell, "parent", None)
+            if worksheet is not None and self._sheet_has_merged_ranges(worksheet):
+                merged_info = self._merged_rich_text_info(cell)
+                if merged_info:
                     try:
-                        value = getattr(cell, attr)
-                        if value:
-                            logger.debug(f"{attr}: {type(value)} = {value}")
-                    except Exception:
-                        pass
-            
-            logger.debug(f"No rich text format detected")
+                        top_left_value = getattr(
+                            worksheet[merged_info["top_left"]], "_value", None
+                        )
+                        if isinstance(top_left_value, CellRichText):
+                            logger.debug("Found rich text in merged cell main cell")
+                            return self._parse_rich_text_object(
+                                top_left_value, cell.coordinate, merged_info
+                            )
+                    except Exception as merged_err:
+                        logger.debug(
+                            f"Error checking merged cell main cell: {merged_err}"
+                        )
+
+            # Diagnostics for cells without detected rich text
+            if logger.isEnabledFor(logging.DEBUG):
+                cell_text = str(cell.value) if cell.value else ""
+                logger.debug(f"Checking cell {cell.coordinate}: '{cell_text[:30]}...'")
+                logger.debug(f"_value type: {type(value)}")
+                if getattr(cell, "richText", None):
+                    logger.debug("Found traditional richText format")
+                if hasattr(value, "__dict__"):
+                    logger.debug(f"_value attributes: {value.__dict__}")
+                for attr in _RICH_ATTRS:
+                    attr_value = getattr(cell, attr, None)
+                    if attr_value:
+                        logger.debug(f"{attr}: {type(attr_value)} = {attr_value}")
+                logger.debug("No rich text format detected")
+
             return None
-            
+
         except Exception as e:
             logger.error(f"Error extracting rich text format: {e}")
             return None
 
+    def _merged_rich_text_info(self, cell) -> Optional[Dict[str, Any]]:
+        """
+        Find the merged range containing a cell, for rich text bookkeeping.
+
+        Args:
+            cell: openpyxl cell object
+
+        Returns:
+            Dictionary with the range and its top-left coordinate, or None
+        """
+        worksheet = getattr(cell, "parent", None)
+        if worksheet is None or not self._sheet_has_merged_ranges(worksheet):
+            return None
+
+        range_info = self._merged_range_at(worksheet, cell.row, cell.column)
+        if range_info is None:
+            return None
+
+        logger.debug("Detected merged cell: %s", range_info["range"])
+        return {"range": range_info["range"], "top_left": range_info["top_left"]}
+
     def _parse_rich_text_object(
-        self, rich_text: CellRichText, coordinate: str, merged_info: Optional[Dict[str, Any]] = None
+        self,
+        rich_text: CellRichText,
+        coordinate: str,
+        merged_info: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Parse rich text object and extract formatting information.
@@ -736,79 +1529,80 @@ class ExcelProcessor(BaseProcessor):
         Returns:
             Rich text information dictionary
         """
-        rich_info = {
-            "has_rich_text": True, 
-            "segments": [],
-            "merged_info": merged_info
-        }
+        rich_info = {"has_rich_text": True, "segments": [], "merged_info": merged_info}
 
-        logger.debug(f"Found rich text format in {coordinate}")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        logger.debug("Found rich text format in %s", coordinate)
         if merged_info:
-            logger.debug(f"Merged cell range: {merged_info['range']}")
+            logger.debug("Merged cell range: %s", merged_info["range"])
+
+        segments = rich_info["segments"]
 
         try:
             for i, item in enumerate(rich_text):
-                if isinstance(item, TextBlock):
+                # CellRichText only holds TextBlock and str items
+                if type(item) is TextBlock:
                     segment_info = {"text": item.text, "font": None, "segment_index": i}
 
-                    # Extract font information
-                    if item.font:
-                        font_info = {
-                            "name": getattr(item.font, "rFont", None),
-                            "size": getattr(item.font, "sz", None),
-                            "bold": getattr(item.font, "b", None),
-                            "italic": getattr(item.font, "i", None),
-                            "underline": getattr(item.font, "u", None),
-                            "color": self._safe_copy_color(getattr(item.font, "color", None)) if getattr(item.font, "color", None) else None
-                        }
-                        
+                    # Extract font information; InlineFont always defines these
+                    # attributes
+                    font = item.font
+                    if font:
+                        color = font.color
+                        font_info = FontInfo(
+                            name=font.rFont,
+                            size=font.sz,
+                            bold=font.b,
+                            italic=font.i,
+                            underline=font.u,
+                            color=self._safe_copy_color(color) if color else None,
+                        )
+
                         # Enhanced color information extraction
-                        if getattr(item.font, "color", None):
-                            font_color = getattr(item.font, "color", None)
-                            font_info['color_raw'] = font_color
-                            if hasattr(font_color, 'rgb') and font_color.rgb:
-                                font_info['color_rgb'] = font_color.rgb
-                            if hasattr(font_color, 'indexed') and font_color.indexed is not None:
-                                font_info['color_indexed'] = font_color.indexed
-                            if hasattr(font_color, 'theme') and font_color.theme is not None:
-                                font_info['color_theme'] = font_color.theme
-                                if hasattr(font_color, 'tint') and font_color.tint is not None:
-                                    font_info['color_tint'] = font_color.tint
-                        
+                        color_key = _color_key(color) if color else None
+                        if color:
+                            font_info.color_raw = color
+                        if color_key:
+                            rgb, indexed, theme, tint, _ = color_key
+                            font_info.color_rgb = rgb
+                            font_info.color_indexed = indexed
+                            font_info.color_theme = theme
+                            font_info.color_tint = tint
+
                         segment_info["font"] = font_info
-                        
-                        # Debug color information
-                        color_str = ""
-                        if getattr(item.font, "color", None):
-                            font_color = getattr(item.font, "color", None)
-                            if hasattr(font_color, 'rgb') and font_color.rgb:
-                                color_str = f" Color:#{font_color.rgb}"
-                            elif hasattr(font_color, 'indexed') and font_color.indexed is not None:
-                                color_str = f" Color:Index({font_color.indexed})"
-                            elif hasattr(font_color, 'theme') and font_color.theme is not None:
-                                color_str = f" Color:Theme({font_color.theme})"
-                                if hasattr(font_color, 'tint') and font_color.tint is not None:
-                                    color_str += f" Tint({font_color.tint})"
+
+                        if debug_enabled:
+                            if font_info.color_rgb:
+                                color_str = f" Color:#{font_info.color_rgb}"
+                            elif font_info.color_indexed is not None:
+                                color_str = f" Color:Index({font_info.color_indexed})"
+                            elif font_info.color_theme is not None:
+                                color_str = (
+                                    f" Color:Theme({font_info.color_theme})"
+                                    f" Tint({font_info.color_tint})"
+                                )
                             else:
-                                color_str = " Color:present"
-                        
-                        logger.debug(f"Text segment {i}: '{item.text[:20]}...' {color_str}")
+                                color_str = " Color:present" if color else ""
+                            logger.debug(
+                                "Text segment %d: '%.20s...' %s",
+                                i,
+                                item.text,
+                                color_str,
+                            )
                     else:
-                        logger.debug(f"Text segment {i}: '{item.text[:20]}...' no font")
-                    
-                    rich_info["segments"].append(segment_info)
+                        logger.debug(
+                            "Text segment %d: '%.20s...' no font", i, item.text
+                        )
+
+                    segments.append(segment_info)
 
                 elif isinstance(item, str):
                     # Plain text segment
-                    rich_info["segments"].append(
-                        {"text": item, "font": None, "segment_index": i}
-                    )
-                    logger.debug(f"Plain text segment {i}: '{item[:20]}...'")
+                    segments.append({"text": item, "font": None, "segment_index": i})
+                    logger.debug("Plain text segment %d: '%.20s...'", i, item)
 
         except Exception as e:
-            logger.error(f"Error parsing rich text object: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error parsing rich text object: %s", e)
 
         return rich_info
 
@@ -818,6 +1612,10 @@ class ExcelProcessor(BaseProcessor):
         """
         Apply formatting to a cell.
 
+        The outcome only depends on the format, the language and the cell's
+        current style, so it is computed once per combination and later cells
+        just copy the resulting style array.
+
         Args:
             cell: openpyxl cell object
             format_info: Format information dictionary
@@ -827,98 +1625,71 @@ class ExcelProcessor(BaseProcessor):
             if not format_info:
                 return
 
+            # format_info dicts are shared per style id and live as long as the workbook
+            style_key = (id(format_info), target_language, tuple(cell._style))
+            applied = self._applied_styles.get(style_key)
+            if applied is not None:
+                cell._style = copy.copy(applied)
+                return
+
+            # Each format entry is read once through a local binding
+            get = format_info.get
+
             # Apply font formatting
             font_kwargs = {}
 
             # Font name (with language-specific adjustments)
-            if target_language == "th" and format_info.get("font_name"):
-                # Use Thai-compatible font
-                thai_fonts = ["TH SarabunPSK", "Tahoma", "Arial Unicode MS"]
-                original_font = format_info["font_name"]
-                if not any(
-                    thai_font.lower() in original_font.lower()
-                    for thai_font in thai_fonts
-                ):
+            original_font = get("font_name")
+            if original_font:
+                if target_language == "th" and not _is_thai_compatible(original_font):
+                    # Use Thai-compatible font
                     font_kwargs["name"] = "TH SarabunPSK"
                 else:
                     font_kwargs["name"] = original_font
-            elif format_info.get("font_name"):
-                font_kwargs["name"] = format_info["font_name"]
 
             # Font size (with adjustment)
-            if format_info.get("font_size"):
-                original_size = format_info["font_size"]
+            original_size = get("font_size")
+            if original_size:
                 adjusted_size = max(6, int(original_size * self.font_size_adjustment))
                 font_kwargs["size"] = adjusted_size
 
             # Other font properties
-            for prop in ["font_bold", "font_italic", "font_underline", "font_strike"]:
-                if format_info.get(prop) is not None:
-                    font_kwargs[prop.replace("font_", "")] = format_info[prop]
+            for prop, name in _FONT_FORMAT_KEYS:
+                value = get(prop)
+                if value is not None:
+                    font_kwargs[name] = value
 
-            # Font color - create a new Color object to avoid StyleProxy issues
-            if format_info.get("font_color"):
-                try:
-                    color_obj = format_info["font_color"]
-                    if hasattr(color_obj, "rgb") and color_obj.rgb:
-                        font_kwargs["color"] = Color(rgb=color_obj.rgb)
-                    elif (
-                        hasattr(color_obj, "indexed") and color_obj.indexed is not None
-                    ):
-                        font_kwargs["color"] = Color(indexed=color_obj.indexed)
-                    elif hasattr(color_obj, "theme") and color_obj.theme is not None:
-                        tint = getattr(color_obj, "tint", None)
-                        font_kwargs["color"] = Color(theme=color_obj.theme, tint=tint)
-                except Exception as e:
-                    logger.debug(f"Could not apply font color: {e}")
+            # Font color, kept as a hashable key so equal fonts share one object
+            font_color = get("font_color")
+            if font_color:
+                font_kwargs["color"] = font_color
 
             if font_kwargs:
-                cell.font = Font(**font_kwargs)
+                cell.font = _make_font(tuple(sorted(font_kwargs.items())))
+
+            # Apply fill formatting - shared PatternFill objects avoid StyleProxy issues
+            fill_color = get("fill_color")
 
-            # Apply fill formatting - create a new PatternFill to avoid StyleProxy issues
-            if format_info.get("fill_object"):
+            if fill_color is not None:
                 try:
-                    fill_obj = format_info["fill_object"]
-                    if hasattr(fill_obj, "fill_type") and hasattr(
-                        fill_obj, "start_color"
-                    ):
-                        start_color = fill_obj.start_color
-                        if hasattr(start_color, "rgb") and start_color.rgb:
-                            cell.fill = PatternFill(
-                                fill_type=fill_obj.fill_type,
-                                start_color=Color(rgb=start_color.rgb),
-                            )
-                        elif (
-                            hasattr(start_color, "indexed")
-                            and start_color.indexed is not None
-                        ):
-                            cell.fill = PatternFill(
-                                fill_type=fill_obj.fill_type,
-                                start_color=Color(indexed=start_color.indexed),
-                            )
-                        elif (
-                            hasattr(start_color, "theme")
-                            and start_color.theme is not None
-                        ):
-                            tint = getattr(start_color, "tint", None)
-                            cell.fill = PatternFill(
-                                fill_type=fill_obj.fill_type,
-                                start_color=Color(theme=start_color.theme, tint=tint),
-                            )
+                    cell.fill = _make_fill(get("fill_type"), fill_color)
                 except Exception as e:
                     logger.debug(f"Could not apply fill formatting: {e}")
 
             # Apply alignment
             alignment_kwargs = {}
-            for prop in ["horizontal", "vertical", "wrap_text", "shrink_to_fit"]:
-                if format_info.get(prop) is not None:
-                    alignment_kwargs[prop] = format_info[prop]
+            for prop in _ALIGNMENT_FORMAT_KEYS:
+                value = get(prop)
+                if value is not None:
+                    alignment_kwargs[prop] = value
 
             if alignment_kwargs:
-                cell.alignment = Alignment(**alignment_kwargs)
+                cell.alignment = _make_alignment(
+                    tuple(sorted(alignment_kwargs.items()))
+                )
 
             # Apply border - create new Border object to avoid StyleProxy issues
-            if format_info.get("border"):
+            if get("has_border"):
                 try:
                     # For now, skip border application to avoid StyleProxy issues
                     # A more complete implementation would recreate the border object
@@ -927,8 +1698,11 @@ class ExcelProcessor(BaseProcessor):
                     logger.debug(f"Could not apply border: {e}")
 
             # Apply number format
-            if format_info.get("number_format"):
-                cell.number_format = format_info["number_format"]
+            number_format = get("number_format")
+            if number_format:
+                cell.number_format = number_format
+
+            self._applied_styles[style_key] = copy.copy(cell._style)
 
         except Exception as e:
             logger.error(f"Error applying cell format: {e}")
@@ -942,7 +1716,7 @@ class ExcelProcessor(BaseProcessor):
         target_language: str = "en",
     ) -> None:
         """
-        Apply rich text formatting to translated text with enhanced multi-segment support.
+        Apply rich text formatting to translated text with multi-segment support.
 
         Args:
             cell: openpyxl cell object
@@ -955,79 +1729,114 @@ class ExcelProcessor(BaseProcessor):
             return
 
         try:
-            logger.debug(f"Applying rich text format to {cell.coordinate}")
-            
+            logger.debug("Applying rich text format to %s", cell.coordinate)
+
             segments = rich_text_info.get("segments", [])
             merged_info = rich_text_info.get("merged_info")
-            
+
             if not segments:
                 return
 
             # Handle merged cells specially
             target_cells = [cell]  # Default to just current cell
-            
+
             if merged_info:
-                logger.debug(f"Processing merged cell: {merged_info['range']}")
+                logger.debug("Processing merged cell: %s", merged_info["range"])
                 # For merged cells, need to sync to all cells
-                target_cells = merged_info.get('all_cells', [cell])
-                logger.debug(f"Target cells count: {len(target_cells)}")
+                target_cells = merged_info.get("all_cells", [cell])
+                logger.debug("Target cells count: %d", len(target_cells))
 
             # Create new rich text parts
             rich_text_parts = []
 
+            # Untranslated text keeps its original segment boundaries
+            if original_text == translated_text:
+                for segment in segments:
+                    segment_text = segment.get("text", "")
+                    if not segment_text:
+                        continue
+                    if segment.get("font"):
+                        inline_font = self._create_inline_font(
+                            segment["font"], target_language
+                        )
+                        rich_text_parts.append(TextBlock(inline_font, segment_text))
+                    else:
+                        rich_text_parts.append(segment_text)
             # If only one segment, apply to entire translated text
-            if len(segments) == 1:
+            elif len(segments) == 1:
                 segment = segments[0]
                 if segment.get("font"):
                     # Create inline font with language support
-                    font_info = segment['font'].copy()
-                    if target_language == 'th':
-                        font_info['target_language'] = 'th'
-                    inline_font = self._create_inline_font(font_info, target_language)
+                    inline_font = self._create_inline_font(
+                        segment["font"], target_language
+                    )
                     rich_text_parts.append(TextBlock(inline_font, translated_text))
-                    logger.debug(f"Single segment applied: {segment.get('font', {}).get('color_rgb', 'default')}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Single segment applied: "
+                            f"{segment['font'].color_rgb or 'default'}"
+                        )
                 else:
                     rich_text_parts.append(translated_text)
             else:
                 # Multiple segments: use enhanced distribution algorithm
-                self._distribute_translated_text_for_merged_cells(segments, original_text, translated_text, rich_text_parts, merged_info, target_language)
-
-            # Apply rich text to all target cells
+                self._distribute_translated_text_for_merged_cells(
+                    segments,
+                    original_text,
+                    translated_text,
+                    rich_text_parts,
+                    merged_info,
+                    target_language,
+                )
+
+            # Apply rich text to all target cells, sharing one CellRichText
             if rich_text_parts:
                 successful_cells = []
                 failed_cells = []
-                
+                rich_text_value = CellRichText(rich_text_parts)
+
                 for target_cell in target_cells:
                     try:
-                        target_cell._value = CellRichText(rich_text_parts)
+                        target_cell._value = rich_text_value
                         successful_cells.append(target_cell.coordinate)
                     except Exception as apply_err:
-                        logger.warning(f"Apply to {target_cell.coordinate} failed: {apply_err}")
+                        logger.warning(
+                            f"Apply to {target_cell.coordinate} failed: {apply_err}"
+                        )
                         failed_cells.append(target_cell.coordinate)
                         # Fall back to plain text
                         try:
                             target_cell.value = translated_text
                         except Exception:
                             pass
-                
+
                 if successful_cells:
-                    logger.debug(f"Rich text applied successfully to: {', '.join(successful_cells)}")
+                    logger.debug(
+                        "Rich text applied successfully to: %s",
+                        ", ".join(successful_cells),
+                    )
                 if failed_cells:
-                    logger.warning(f"Application failed for cells: {', '.join(failed_cells)}")
+                    logger.warning(
+                        f"Application failed for cells: {', '.join(failed_cells)}"
+                    )
 
         except Exception as e:
-            logger.error(f"Error applying rich text format: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error applying rich text format: %s", e)
             # Fall back to plain text
             cell.value = translated_text
-    
-    def _distribute_translated_text_for_merged_cells(self, segments: List[Dict], original_text: str, 
-                                                    translated_text: str, rich_text_parts: List, 
-                                                    merged_info: Optional[Dict[str, Any]], target_language: str = 'en') -> None:
+
+    def _distribute_translated_text_for_merged_cells(
+        self,
+        segments: List[Dict],
+        original_text: str,
+        translated_text: str,
+        rich_text_parts: List,
+        merged_info: Optional[Dict[str, Any]],
+        target_language: str = "en",
+    ) -> None:
         """
         Enhanced text distribution algorithm optimized for merged cells.
-        
+
         Args:
             segments: Original text segments list
             original_text: Original complete text
@@ -1037,79 +1846,89 @@ class ExcelProcessor(BaseProcessor):
             target_language: Target language code
         """
         try:
-            logger.debug(f"Enhanced text distribution for merged cells")
+            logger.debug("Enhanced text distribution for merged cells")
             if merged_info:
-                logger.debug(f"Merged range: {merged_info.get('range', 'unknown')}")
-            
+                logger.debug("Merged range: %s", merged_info.get("range", "unknown"))
+
             # For merged cells, use more intelligent distribution strategy
             if len(segments) <= 2:
                 # If few segments, distribute by proportion
-                self._distribute_translated_text(segments, original_text, translated_text, rich_text_parts, target_language)
+                self._distribute_translated_text(
+                    segments,
+                    original_text,
+                    translated_text,
+                    rich_text_parts,
+                    target_language,
+                )
                 return
-            
+
             # For multi-segment merged cells, prioritize main color segments
-            # Find the longest segment as main segment
-            main_segment = max(segments, key=lambda s: len(s.get('text', '')))
-            main_segment_index = segments.index(main_segment)
-            
-            # Distribution strategy: main segment gets 70% of translated text, others get remaining
-            main_portion = 0.7
-            
-            translated_len = len(translated_text)
-            main_text_len = int(translated_len * main_portion)
-            other_text_len = translated_len - main_text_len
-            
-            # Distribute text
-            other_segments = [s for i, s in enumerate(segments) if i != main_segment_index]
-            other_segment_len = other_text_len // len(other_segments) if other_segments else 0
-            
-            current_pos = 0
+            # Find the longest segment as main segment (first one wins ties)
+            main_segment_index, longest = 0, -1
             for i, segment in enumerate(segments):
-                if i == main_segment_index:
-                    # Main segment
-                    segment_text = translated_text[current_pos:current_pos + main_text_len]
-                    current_pos += main_text_len
-                else:
-                    # Other segments
-                    if i == len(segments) - 1:
-                        # Last segment, use all remaining text
-                        segment_text = translated_text[current_pos:]
-                    else:
-                        segment_text = translated_text[current_pos:current_pos + other_segment_len]
-                        current_pos += other_segment_len
-                
+                length = len(segment.get("text", ""))
+                if length > longest:
+                    main_segment_index, longest = i, length
+
+            # Distribution strategy: main segment gets 70% of translated text and the
+            # other segments share the remaining 30% equally
+            other_count = len(segments) - 1
+            weights = tuple(
+                7 * other_count if i == main_segment_index else 3
+                for i in range(len(segments))
+            )
+            cuts = _split_points(weights, len(translated_text))
+
+            for i, (start, end) in enumerate(zip((0,) + cuts[:-1], cuts)):
+                segment = segments[i]
+                segment_text = translated_text[start:end]
+
                 # Create text block with language support
                 if segment.get("font"):
-                    font_info = segment['font'].copy()
-                    if target_language == 'th':
-                        font_info['target_language'] = 'th'
-                    inline_font = self._create_inline_font(font_info, target_language)
+                    inline_font = self._create_inline_font(
+                        segment["font"], target_language
+                    )
                     rich_text_parts.append(TextBlock(inline_font, segment_text))
-                    
+
                     # Display color info
-                    color_info = ""
-                    if segment.get('font', {}).get('color_rgb'):
-                        color_info = f" Color:#{segment['font']['color_rgb']}"
-                    elif segment.get('font', {}).get('color_indexed'):
-                        color_info = f" Color:Indexed({segment['font']['color_indexed']})"
-                    elif segment.get('font', {}).get('color_theme'):
-                        color_info = f" Color:Theme({segment['font']['color_theme']})"
-                    
-                    logger.debug(f"Segment {i}: '{segment_text[:20]}...'{color_info}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        color_info = ""
+                        font_info = segment["font"]
+                        if font_info.color_rgb:
+                            color_info = f" Color:#{font_info.color_rgb}"
+                        elif font_info.color_indexed:
+                            color_info = f" Color:Indexed({font_info.color_indexed})"
+                        elif font_info.color_theme:
+                            color_info = f" Color:Theme({font_info.color_theme})"
+                        logger.debug(
+                            "Segment %d: '%.20s...'%s", i, segment_text, color_info
+                        )
                 else:
                     rich_text_parts.append(segment_text)
-                    logger.debug(f"Segment {i}: '{segment_text[:20]}...' no format")
-            
+                    logger.debug("Segment %d: '%.20s...' no format", i, segment_text)
+
         except Exception as e:
             logger.warning(f"Enhanced text distribution failed: {e}")
             # Fall back to simple distribution
-            self._distribute_translated_text(segments, original_text, translated_text, rich_text_parts, target_language)
-    
-    def _distribute_translated_text(self, segments: List[Dict], original_text: str, 
-                                   translated_text: str, rich_text_parts: List, target_language: str = 'en') -> None:
+            self._distribute_translated_text(
+                segments,
+                original_text,
+                translated_text,
+                rich_text_parts,
+                target_language,
+            )
+
+    def _distribute_translated_text(
+        self,
+        segments: List[Dict],
+        original_text: str,
+        translated_text: str,
+        rich_text_parts: List,
+        target_language: str = "en",
+    ) -> None:
         """
         Distribute translated text proportionally among segments.
-        
+
         Args:
             segments: Original text segments list
             original_text: Original complete text
@@ -1122,72 +1941,61 @@ class ExcelProcessor(BaseProcessor):
             total_length = len(original_text)
             if total_length == 0:
                 return
-            
-            # Simplification: if too many segments, use first segment's format for entire text
+
+            # Simplification: if too many segments, use first segment's format for
+            # entire text
             if len(segments) > 5:
                 first_segment = segments[0]
                 if first_segment.get("font"):
-                    font_info = first_segment['font'].copy()
-                    if target_language == 'th':
-                        font_info['target_language'] = 'th'
-                    inline_font = self._create_inline_font(font_info, target_language)
+                    inline_font = self._create_inline_font(
+                        first_segment["font"], target_language
+                    )
                     rich_text_parts.append(TextBlock(inline_font, translated_text))
                 else:
                     rich_text_parts.append(translated_text)
                 return
-            
-            # Proportional distribution
-            translated_pos = 0
-            for i, segment in enumerate(segments):
-                segment_text = segment.get('text', '')
-                segment_length = len(segment_text)
-                
-                if segment_length == 0:
+
+            # Proportional distribution using exact cumulative split points
+            lengths = tuple(len(segment.get("text", "")) for segment in segments)
+            cuts = _split_points(lengths, len(translated_text))
+
+            for i, (start, end) in enumerate(zip((0,) + cuts[:-1], cuts)):
+                if lengths[i] == 0:
                     continue
-                
-                # Calculate proportion for this segment
-                if i == len(segments) - 1:
-                    # Last segment, use all remaining text
-                    segment_translated = translated_text[translated_pos:]
-                else:
-                    # Proportional calculation
-                    proportion = segment_length / total_length
-                    segment_translated_length = int(len(translated_text) * proportion)
-                    segment_translated = translated_text[translated_pos:translated_pos + segment_translated_length]
-                    translated_pos += segment_translated_length
-                
+
+                segment = segments[i]
+                segment_translated = translated_text[start:end]
+
                 # Create text block
                 if segment.get("font"):
-                    font_info = segment['font'].copy()
-                    if target_language == 'th':
-                        font_info['target_language'] = 'th'
-                    inline_font = self._create_inline_font(font_info, target_language)
+                    inline_font = self._create_inline_font(
+                        segment["font"], target_language
+                    )
                     rich_text_parts.append(TextBlock(inline_font, segment_translated))
                 else:
                     rich_text_parts.append(segment_translated)
-            
+
         except Exception as e:
             logger.warning(f"Text distribution failed: {e}")
             # Fall back: use first segment's format
             if segments:
                 first_segment = segments[0]
                 if first_segment.get("font"):
-                    font_info = first_segment['font'].copy()
-                    if target_language == 'th':
-                        font_info['target_language'] = 'th'
-                    inline_font = self._create_inline_font(font_info, target_language)
+                    inline_font = self._create_inline_font(
+                        first_segment["font"], target_language
+                    )
                     rich_text_parts.append(TextBlock(inline_font, translated_text))
                 else:
                     rich_text_parts.append(translated_text)
 
     def _create_inline_font(
-        self, font_info: Dict[str, Any], target_language: str = "en"
+        self, font_info: FontInfo, target_language: str = "en"
     ) -> InlineFont:
         """
         Create an InlineFont object from font information with enhanced color support.
 
         Args:
-            font_info: Font information dictionary
+            font_info: Font information of a rich text segment
             target_language: Target language code
 
         Returns:
@@ -1195,269 +2003,176 @@ class ExcelProcessor(BaseProcessor):
         """
         font_kwargs = {}
 
-        if font_info.get("name"):
-            font_kwargs["rFont"] = font_info["name"]
+        if font_info.name:
+            font_kwargs["rFont"] = font_info.name
         # For Thai rich text, set appropriate font
-        elif 'target_language' in font_info and font_info['target_language'] == 'th':
-            font_kwargs["rFont"] = "TH SarabunPSK"
         elif target_language == "th":
             font_kwargs["rFont"] = "TH SarabunPSK"
 
-        if font_info.get("size"):
-            font_kwargs["sz"] = font_info["size"]
-        if font_info.get("bold"):
-            font_kwargs["b"] = font_info["bold"]
-        if font_info.get("italic"):
-            font_kwargs["i"] = font_info["italic"]
-        if font_info.get("underline"):
+        if font_info.size:
+            font_kwargs["sz"] = font_info.size
+        if font_info.bold:
+            font_kwargs["b"] = font_info.bold
+        if font_info.italic:
+            font_kwargs["i"] = font_info.italic
+        if font_info.underline:
             # Fix underline value validation issue
-            underline_value = font_info["underline"]
+            underline_value = font_info.underline
             if underline_value is True:
                 font_kwargs["u"] = "single"
-            elif underline_value in ['single', 'singleAccounting', 'double', 'doubleAccounting']:
+            elif underline_value in [
+                "single",
+                "singleAccounting",
+                "double",
+                "doubleAccounting",
+            ]:
                 font_kwargs["u"] = underline_value
             # Other cases don't set underline
 
-        # Enhanced color handling
-        if font_info.get("color"):
-            try:
-                font_kwargs["color"] = font_info["color"]
-                logger.debug(f"Using original color object")
-            except Exception as color_err:
-                logger.debug(f"Using original color object failed: {color_err}")
-                
-                # Try using backup color information
-                if font_info.get('color_rgb'):
-                    try:
-                        font_kwargs["color"] = Color(rgb=font_info['color_rgb'])
-                        logger.debug(f"Using RGB color: #{font_info['color_rgb']}")
-                    except Exception as rgb_err:
-                        logger.debug(f"Using RGB color failed: {rgb_err}")
-                        
-                elif font_info.get('color_indexed') is not None:
-                    try:
-                        font_kwargs["color"] = Color(indexed=font_info['color_indexed'])
-                        logger.debug(f"Using indexed color: {font_info['color_indexed']}")
-                    except Exception as idx_err:
-                        logger.debug(f"Using indexed color failed: {idx_err}")
-                        
-                elif font_info.get('color_theme') is not None:
-                    try:
-                        if font_info.get('color_tint') is not None:
-                            font_kwargs["color"] = Color(theme=font_info['color_theme'], tint=font_info['color_tint'])
-                            logger.debug(f"Using theme color: {font_info['color_theme']} tint: {font_info['color_tint']}")
-                        else:
-                            font_kwargs["color"] = Color(theme=font_info['color_theme'])
-                            logger.debug(f"Using theme color: {font_info['color_theme']}")
-                    except Exception as theme_err:
-                        logger.debug(f"Using theme color failed: {theme_err}")
+        # Enhanced color handling: prefer the copied color, else rebuild from primitives
+        color = font_info.color
+        if color is not None:
+            color_key = _color_key(color)
+            if color_key is None:
+                # Unrecognised color type: keep the object and skip the cache
+                return InlineFont(color=color, **font_kwargs)
+        elif (
+            font_info.color_rgb
+            or font_info.color_indexed is not None
+            or font_info.color_theme is not None
+        ):
+            color_key = (
+                font_info.color_rgb,
+                font_info.color_indexed,
+                font_info.color_theme,
+                font_info.color_tint,
+                None,
+            )
+        else:
+            color_key = None
+
+        return _cached_inline_font(
+            font_kwargs.get("rFont"),
+            font_kwargs.get("sz"),
+            font_kwargs.get("b"),
+            font_kwargs.get("i"),
+            font_kwargs.get("u"),
+            color_key,
+        )
 
-        return InlineFont(**font_kwargs)
-    
     def _safe_copy_color(self, color_obj) -> Optional[Color]:
         """
         Safely copy color object to avoid StyleProxy issues.
-        
+
+        Copies are shared between segments with the same color.
+
         Args:
             color_obj: Original color object
-            
+
         Returns:
-            New color object or None
+            Detached color object or None
         """
         if not color_obj:
             return None
-        
+
         try:
-            # Method 1: Priority use RGB values
-            if hasattr(color_obj, 'rgb') and color_obj.rgb:
-                new_color = Color(rgb=color_obj.rgb)
-                logger.debug(f"Copied RGB color: #{color_obj.rgb}")
-                return new_color
-            
-            # Method 2: Use indexed color
-            elif hasattr(color_obj, 'indexed') and color_obj.indexed is not None:
-                new_color = Color(indexed=color_obj.indexed)
-                logger.debug(f"Copied indexed color: {color_obj.indexed}")
-                return new_color
-            
-            # Method 3: Use theme color
-            elif hasattr(color_obj, 'theme') and color_obj.theme is not None:
-                if hasattr(color_obj, 'tint') and color_obj.tint is not None:
-                    new_color = Color(theme=color_obj.theme, tint=color_obj.tint)
-                    logger.debug(f"Copied theme color: {color_obj.theme} tint: {color_obj.tint}")
-                else:
-                    new_color = Color(theme=color_obj.theme)
-                    logger.debug(f"Copied theme color: {color_obj.theme}")
-                return new_color
-            
-            # Method 4: Use auto color
-            elif hasattr(color_obj, 'auto') and color_obj.auto is not None:
-                new_color = Color(auto=color_obj.auto)
-                logger.debug(f"Copied auto color: {color_obj.auto}")
-                return new_color
-            
-            # Method 5: Try to return original object
-            else:
-                logger.debug(f"Using original color object")
-                return color_obj
-                
+            color_key = _color_key(color_obj)
+            if color_key is not None:
+                return _cached_color(*color_key)
+
+            logger.debug("Using original color object")
+            return color_obj
+
         except Exception as e:
             logger.warning(f"Failed to copy color object: {e}")
-            
-            # Final fallback: try to extract all possible color information
-            try:
-                # Check object attributes
-                if hasattr(color_obj, '__dict__'):
-                    attrs = color_obj.__dict__
-                    logger.debug(f"Color object attributes: {attrs}")
-                    
-                    # Try to construct new color object
-                    color_kwargs = {}
-                    for attr in ['rgb', 'indexed', 'theme', 'tint', 'auto']:
-                        if hasattr(color_obj, attr) and getattr(color_obj, attr) is not None:
-                            color_kwargs[attr] = getattr(color_obj, attr)
-                    
-                    if color_kwargs:
-                        new_color = Color(**color_kwargs)
-                        logger.debug(f"Constructed color from attributes: {color_kwargs}")
-                        return new_color
-                
-                # If all methods fail, return original object
-                return color_obj
-                
-            except Exception as backup_err:
-                logger.warning(f"Backup color copy method also failed: {backup_err}")
-                return color_obj  # Return original object as last resort
-    
-    def _check_merged_cell(self, cell) -> Optional[Dict[str, Any]]:
-        """
-        Check if cell is part of a merged cell and return related information.
-        
+            return color_obj  # Return original object as last resort
+
+    def _sheet_has_merged_ranges(self, worksheet) -> bool:
+        """
+        Check whether a worksheet has any merged ranges, caching the answer per sheet.
+
         Args:
-            cell: openpyxl cell object
-            
+            worksheet: openpyxl worksheet object
+
         Returns:
-            Merged cell information dictionary or None
+            True if the worksheet contains merged cells
         """
-        try:
-            worksheet = cell.parent
-            if not worksheet or not hasattr(worksheet, 'merged_cells'):
-                return None
-            
-            cell_coord = cell.coordinate
-            for merged_range in worksheet.merged_cells.ranges:
-                if cell_coord in merged_range:
-                    # Get all cells in the merged range
-                    all_cells = []
-                    for row in worksheet[merged_range.coord]:
-                        if isinstance(row, (list, tuple)):
-                            all_cells.extend(row)
-                        else:
-                            all_cells.append(row)
-                    
-                    return {
-                        'is_merged': True,
-                        'range': str(merged_range),
-                        'top_left': merged_range.coord.split(':')[0],
-                        'bottom_right': merged_range.coord.split(':')[1] if ':' in merged_range.coord else merged_range.coord.split(':')[0],
-                        'all_cells': all_cells,
-                        'merged_range_obj': merged_range
-                    }
-            
+        has_merges = self._sheet_has_merges.get(worksheet.title)
+        if has_merges is None:
+            merged_cells = getattr(worksheet, "merged_cells", None)
+            has_merges = bool(merged_cells and merged_cells.ranges)
+            self._sheet_has_merges[worksheet.title] = has_merges
+        return has_merges
+
+    def _merged_range_at(
+        self, worksheet, row: int, column: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up the merged range covering a cell position.
+
+        The first lookup on a worksheet buckets its merged ranges by row, sorted
+        by first column. Ranges never overlap, so a lookup is one dictionary
+        access plus a bisect on the column instead of a scan over all ranges.
+
+        Args:
+            worksheet: openpyxl worksheet object
+            row: 1-based row index
+            column: 1-based column index
+
+        Returns:
+            Shared merged range information (treat as read-only), or None
+        """
+        index = self._merge_index.get(worksheet.title)
+        if index is None:
+            index = self._build_merge_index(worksheet)
+            self._merge_index[worksheet.title] = index
+
+        bucket = index.get(row)
+        if bucket is None:
             return None
-            
-        except Exception as e:
-            logger.error(f"Error checking merged cell: {e}")
+
+        starts, entries = bucket
+        position = bisect.bisect_right(starts, column) - 1
+        if position < 0:
             return None
-    
-    def _synchronize_merged_cell_formats(self, cell, original_text: str, translated_text: str, 
-                                        format_info: Dict[str, Any], rich_text_info: Optional[Dict[str, Any]], 
-                                        merged_cell_info: Dict[str, Any]) -> None:
+        max_col, range_info = entries[position]
+        return range_info if column <= max_col else None
+
+    @staticmethod
+    def _build_merge_index(worksheet) -> Dict[int, Tuple[List[int], List[tuple]]]:
         """
-        Synchronize merged cell formats to all related cells.
-        
+        Bucket a worksheet's merged ranges by row.
+
         Args:
-            cell: Current cell
-            original_text: Original text
-            translated_text: Translated text
-            format_info: Format information
-            rich_text_info: Rich text information
-            merged_cell_info: Merged cell information
+            worksheet: openpyxl worksheet object
+
+        Returns:
+            Dictionary mapping each covered row to parallel lists of first
+            columns and (last column, range info) pairs, sorted by first column
         """
-        try:
-            logger.debug(f"Synchronizing merged cell format: {merged_cell_info['range']}")
-            
-            # Get all merged cells
-            all_cells = merged_cell_info.get('all_cells', [])
-            if not all_cells:
-                logger.debug(f"No merged cell list found, using backup method")
-                # Backup method: manually get from worksheet
-                worksheet = cell.parent
-                merged_range = merged_cell_info['merged_range_obj']
-                for row_cells in worksheet[merged_range.coord]:
-                    if isinstance(row_cells, (list, tuple)):
-                        all_cells.extend(row_cells)
-                    else:
-                        all_cells.append(row_cells)
-            
-            # Synchronize to all cells
-            successful_syncs = []
-            failed_syncs = []
-            
-            for target_cell in all_cells:
-                try:
-                    # Skip current cell (already processed)
-                    if target_cell.coordinate == cell.coordinate:
-                        continue
-                        
-                    # Set text value first
-                    target_cell.value = translated_text
-                    
-                    # Apply basic format
-                    if format_info:
-                        self._apply_cell_format(target_cell, format_info)
-                    
-                    # Apply rich text format if available
-                    if rich_text_info and rich_text_info.get("has_rich_text"):
-                        self._apply_rich_text_format(
-                            target_cell, original_text, translated_text, rich_text_info
-                        )
-                    
-                    successful_syncs.append(target_cell.coordinate)
-                    
-                except Exception as sync_err:
-                    logger.warning(f"Synchronization to {target_cell.coordinate} failed: {sync_err}")
-                    failed_syncs.append(target_cell.coordinate)
-                    
-                    # Try to at least sync text content
-                    try:
-                        target_cell.value = translated_text
-                    except Exception:
-                        pass
-            
-            # Report synchronization results
-            if successful_syncs:
-                logger.debug(f"Successfully synchronized to: {', '.join(successful_syncs)}")
-            if failed_syncs:
-                logger.warning(f"Synchronization failed: {', '.join(failed_syncs)}")
-            
-            # Special handling: if rich text exists and there are failures, try simpler sync
-            if rich_text_info and failed_syncs:
-                logger.debug(f"Trying simplified synchronization method...")
-                for coord in failed_syncs:
-                    try:
-                        target_cell = cell.parent[coord]
-                        # Use first segment's format for entire text
-                        segments = rich_text_info.get('segments', [])
-                        if segments and segments[0].get('font'):
-                            inline_font = self._create_inline_font(segments[0]['font'])
-                            target_cell._value = CellRichText([TextBlock(inline_font, translated_text)])
-                            logger.debug(f"Simplified sync successful: {coord}")
-                    except Exception as simple_err:
-                        logger.warning(f"Simplified sync also failed: {coord} - {simple_err}")
-            
-        except Exception as e:
-            logger.error(f"Error synchronizing merged cell formats: {e}")
+        rows = defaultdict(list)
+        for merged_range in worksheet.merged_cells.ranges:
+            min_row, min_col = merged_range.min_row, merged_range.min_col
+            max_row, max_col = merged_range.max_row, merged_range.max_col
+            range_info = {
+                "is_merged": True,
+                "range": str(merged_range),
+                "top_left": f"{_COL_LETTERS[min_col - 1]}{min_row}",
+                "bottom_right": f"{_COL_LETTERS[max_col - 1]}{max_row}",
+                "merged_range_obj": merged_range,
+            }
+            entry = (min_col, max_col, range_info)
+            for range_row in range(min_row, max_row + 1):
+                rows[range_row].append(entry)
+
+        index = {}
+        for range_row, row_entries in rows.items():
+            row_entries.sort(key=lambda entry: entry[0])
+            index[range_row] = (
+                [entry[0] for entry in row_entries],
+                [(entry[1], entry[2]) for entry in row_entries],
+            )
+        return index
 
     def _smart_adjust_column_width(self, workbook) -> None:
         """
@@ -1467,49 +2182,103 @@ class ExcelProcessor(BaseProcessor):
             workbook: openpyxl workbook object
         """
         try:
+            # Stringified lengths of repeated non-text values (numbers, dates),
+            # shared by all sheets of the workbook
+            length_cache: Dict[Tuple[type, Any], int] = {}
+
             for sheet_name in workbook.sheetnames:
                 sheet = workbook[sheet_name]
+                if not sheet._cells:
+                    continue
 
-                # Get image-occupied columns if image protection is enabled
-                occupied_columns = set()
-                if self.image_protection and sheet_name in self.image_data:
-                    for img_info in self.image_data[sheet_name]:
-                        anchor_info = img_info.get("anchor_info", {})
-                        if anchor_info.get("type") == "two_cell":
-                            from_col = anchor_info.get("from_col", 0)
-                            to_col = anchor_info.get("to_col", 0)
-                            for col in range(from_col, to_col + 1):
-                                occupied_columns.add(col)
-
-                # Adjust column widths
-                for column in sheet.columns:
-                    max_length = 0
-                    column_letter = get_column_letter(column[0].column)
-                    column_index = column[0].column
-
-                    # Check if column has images
-                    is_occupied = column_index in occupied_columns
-
-                    for cell in column:
-                        try:
-                            if cell.value:
-                                cell_length = len(str(cell.value))
-                                if cell_length > max_length:
-                                    max_length = cell_length
-                        except Exception:
-                            pass
-
-                    # Set column width (conservative for image-occupied columns)
-                    if is_occupied:
-                        adjusted_width = min(max_length + 1, 30)
+                # Get image-occupied column intervals if image protection is enabled
+                occupied_starts, occupied_ends = [], []
+                if self.image_protection and self.image_data.get(sheet_name):
+                    occupied_starts, occupied_ends = self._image_columns.get(
+                        sheet_name
+                    ) or self._image_column_intervals(self.image_data[sheet_name])
+
+                # Width rules per column (conservative for image-occupied columns):
+                # (padding, maximum width); lengths past maximum - padding are capped
+                rules = []
+                for column_index in range(1, sheet.max_column + 1):
+                    position = bisect.bisect_right(occupied_starts, column_index) - 1
+                    if position >= 0 and column_index <= occupied_ends[position]:
+                        rules.append((1, 30))
                     else:
-                        adjusted_width = min(max_length + 2, 50)
+                        rules.append((2, 50))
+                caps = [limit - padding for padding, limit in rules]
+
+                # Longest value per column in one pass over the stored cells;
+                # walking sheet.columns would create every empty cell in the grid
+                max_lengths = [0] * len(rules)
+                for (_, column_index), cell in sheet._cells.items():
+                    slot = column_index - 1
+                    # The width is already capped, so this column needs no more work
+                    if max_lengths[slot] >= caps[slot]:
+                        continue
+                    value = cell.value
+                    if not value:
+                        continue
+                    if isinstance(value, str):
+                        cell_length = len(value)
+                    elif isinstance(value, _LENGTH_CACHEABLE):
+                        key = (value.__class__, value)
+                        cell_length = length_cache.get(key)
+                        if cell_length is None:
+                            cell_length = length_cache[key] = len(str(value))
+                    else:
+                        cell_length = len(str(value))
+                    if cell_length > max_lengths[slot]:
+                        max_lengths[slot] = cell_length
+
+                widths = {
+                    _COL_LETTERS[slot]: min(max_length + padding, limit)
+                    for slot, (max_length, (padding, limit)) in enumerate(
+                        zip(max_lengths, rules)
+                    )
+                }
 
-                    sheet.column_dimensions[column_letter].width = adjusted_width
+                # Only touch dimensions whose width actually changes
+                column_dimensions = sheet.column_dimensions
+                for column_letter, adjusted_width in widths.items():
+                    dimension = column_dimensions.get(column_letter)
+                    if dimension is not None and dimension.width == adjusted_width:
+                        continue
+                    column_dimensions[column_letter].width = adjusted_width
 
         except Exception as e:
             logger.error(f"Error adjusting column widths: {e}")
 
+    @staticmethod
+    def _image_column_intervals(
+        images: List[Dict[str, Any]],
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Merge the column spans of two-cell anchored images into sorted intervals.
+
+        Args:
+            images: Image information list of one worksheet
+
+        Returns:
+            Tuple of (interval starts, inclusive interval ends)
+        """
+        spans = []
+        for img_info in images:
+            anchor_builder = img_info.get("anchor_builder")
+            if anchor_builder and anchor_builder[0] == "two_cell":
+                spans.append((anchor_builder[1][0], anchor_builder[1][4]))
+
+        starts: List[int] = []
+        ends: List[int] = []
+        for from_col, to_col in sorted(spans):
+            if ends and from_col <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], to_col)
+            else:
+                starts.append(from_col)
+                ends.append(to_col)
+        return starts, ends
+
 
 # Backward compatibility alias
 ExcelTranslator = ExcelProcessor
@@ -6,7 +6,11 @@ Note: PDF translation is complex and may have limitations.
 """
 
 import logging
-from typing import List, Dict, Any
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -16,11 +20,157 @@ try:
 except ImportError:
     PYPDF2_AVAILABLE = False
 
+try:
+    import fitz  # PyMuPDF
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 from .base import BaseProcessor
 from ..exceptions.errors import PDFProcessorError
 
 logger = logging.getLogger(__name__)
 
+# PDFs with fewer pages than this are extracted in-process; below it the cost
+# of starting worker processes outweighs the parallel speed-up
+PARALLEL_EXTRACT_MIN_PAGES = 8
+
+# Text extraction backends: PyPDF2 (pure Python, always required) and the
+# optional, much faster MuPDF engine
+PDF_BACKEND_PYPDF2 = "pypdf2"
+PDF_BACKEND_PYMUPDF = "pymupdf"
+PDF_BACKENDS = (PDF_BACKEND_PYPDF2, PDF_BACKEND_PYMUPDF)
+
+# Paragraph break: two line breaks, possibly with blank-looking space between
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+
+
+@contextmanager
+def _open_pages(file_path: str, backend: str):
+    """
+    Open a PDF with the given backend and yield its page sequence.
+
+    Args:
+        file_path: Path to the PDF file
+        backend: PDF_BACKEND_PYPDF2 or PDF_BACKEND_PYMUPDF
+
+    Yields:
+        Indexable sequence of backend page objects
+    """
+    if backend == PDF_BACKEND_PYMUPDF:
+        document = fitz.open(file_path)
+        try:
+            yield document
+        finally:
+            document.close()
+    else:
+        with open(file_path, "rb") as file:
+            yield PyPDF2.PdfReader(file).pages
+
+
+def _page_text(page, backend: str) -> str:
+    """
+    Return the text of one page with paragraphs separated by blank lines.
+
+    MuPDF's plain text output does not mark paragraph breaks, so its text
+    blocks are joined with blank lines to match what PyPDF2 produces.
+
+    Args:
+        page: Backend page object
+        backend: PDF_BACKEND_PYPDF2 or PDF_BACKEND_PYMUPDF
+
+    Returns:
+        Page text
+    """
+    if backend == PDF_BACKEND_PYMUPDF:
+        # Block tuples are (x0, y0, x1, y1, text, block_no, block_type);
+        # type 0 is text, 1 is an image
+        return "\n\n".join(
+            block[4] for block in page.get_text("blocks") if block[6] == 0
+        )
+    return page.extract_text()
+
+
+def _extract_page_range(
+    file_path: str, start: int, stop: int, backend: str = PDF_BACKEND_PYPDF2
+) -> List[Dict[str, Any]]:
+    """
+    Extract paragraphs from a contiguous range of PDF pages.
+
+    Runs in a worker process, so it opens its own reader instead of sharing
+    one across processes.
+
+    Args:
+        file_path: Path to the PDF file
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract
+        backend: Text extraction backend
+
+    Returns:
+        List of paragraph dictionaries for the pages, in page order
+    """
+    seen: Dict[str, str] = {}
+    with _open_pages(file_path, backend) as pages:
+        return [
+            item
+            for page_num in range(start, stop)
+            for item in _extract_page_paragraphs(
+                pages[page_num], page_num, backend, seen
+            )
+        ]
+
+
+def _extract_page_paragraphs(
+    page,
+    page_num: int,
+    backend: str = PDF_BACKEND_PYPDF2,
+    seen: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Split the text of one PDF page into paragraph dictionaries.
+
+    Args:
+        page: Backend page object
+        page_num: Zero-based page index
+        backend: Text extraction backend
+        seen: Paragraphs already extracted from this document; repeated
+            paragraphs (running headers, footers) reuse the stored string
+
+    Returns:
+        List of paragraph dictionaries (empty if the page fails to extract)
+    """
+    text_data = []
+    try:
+        page_text = _page_text(page, backend)
+
+        # Split page text into stripped, non-empty paragraphs
+        paragraphs = filter(None, map(str.strip, _PARAGRAPH_SPLIT.split(page_text)))
+
+        for para_idx, paragraph in enumerate(paragraphs):
+            if seen is not None:
+                paragraph = seen.setdefault(paragraph, paragraph)
+            text_data.append(
+                {
+                    "text": paragraph,
+                    "page_number": page_num + 1,
+                    "paragraph_index": para_idx,
+                    "type": "paragraph",
+                }
+            )
+
+            logger.debug(
+                "Extracted text from page %d, paragraph %d: '%s...'",
+                page_num + 1,
+                para_idx,
+                paragraph[:50],
+            )
+
+    except Exception as e:
+        logger.error(f"Error extracting text from page {page_num + 1}: {e}")
+
+    return text_data
+
 
 class PDFProcessor(BaseProcessor):
     """
@@ -45,6 +195,19 @@ class PDFProcessor(BaseProcessor):
 
         super().__init__(**kwargs)
 
+        # PDF-specific settings. Extraction runs in-process by default (1);
+        # worker processes are opt-in (0 means one per CPU), as their start-up
+        # cost usually outweighs the speed-up and the spawn start method needs
+        # the calling script to guard its entry point with __main__
+        self.extract_workers = getattr(self.config.processor, "pdf_extract_workers", 1)
+        self.backend = getattr(self.config.processor, "pdf_backend", PDF_BACKEND_PYPDF2)
+        if self.backend == PDF_BACKEND_PYMUPDF and not PYMUPDF_AVAILABLE:
+            logger.warning(
+                "PyMuPDF is not available, falling back to PyPDF2 for PDF text "
+                "extraction. Install with: pip install PyMuPDF"
+            )
+            self.backend = PDF_BACKEND_PYPDF2
+
     def supports_file_type(self, file_path: str) -> bool:
         """
         Check if file type is supported.
@@ -71,41 +234,23 @@ class PDFProcessor(BaseProcessor):
         text_data = []
 
         try:
-            with open(file_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
+            with _open_pages(file_path, self.backend) as pages:
+                page_count = len(pages)
                 logger.info(f"Successfully opened PDF file: {file_path}")
-                logger.info(f"PDF has {len(reader.pages)} pages")
-
-                for page_num, page in enumerate(reader.pages):
-                    try:
-                        page_text = page.extract_text()
-
-                        if page_text.strip():
-                            # Split page text into paragraphs
-                            paragraphs = [
-                                p.strip() for p in page_text.split("\n\n") if p.strip()
-                            ]
-
-                            for para_idx, paragraph in enumerate(paragraphs):
-                                if paragraph:
-                                    text_data.append(
-                                        {
-                                            "text": paragraph,
-                                            "page_number": page_num + 1,
-                                            "paragraph_index": para_idx,
-                                            "type": "paragraph",
-                                        }
-                                    )
-
-                                    logger.debug(
-                                        f"Extracted text from page {page_num + 1}, paragraph {para_idx}: '{paragraph[:50]}...'"
-                                    )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error extracting text from page {page_num + 1}: {e}"
+                logger.info(f"PDF has {page_count} pages")
+
+                ranges = self._page_ranges(page_count)
+                if len(ranges) <= 1:
+                    seen: Dict[str, str] = {}
+                    for page_num in range(page_count):
+                        text_data.extend(
+                            _extract_page_paragraphs(
+                                pages[page_num], page_num, self.backend, seen
+                            )
                         )
-                        continue
+
+            if len(ranges) > 1:
+                text_data = self._extract_pages_in_parallel(file_path, ranges)
 
             logger.info(f"Total extracted {len(text_data)} text elements from PDF")
             return text_data
@@ -117,6 +262,70 @@ class PDFProcessor(BaseProcessor):
                 file_path=file_path,
             ) from e
 
+    def _page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        """
+        Split the pages into one contiguous range per extraction worker.
+
+        Each worker parses the file once, so pages are handed out in ranges
+        rather than one by one.
+
+        Args:
+            page_count: Number of pages in the PDF
+
+        Returns:
+            List of (start, stop) page ranges; a single range means the
+            pages are extracted in-process
+        """
+        workers = self.extract_workers or os.cpu_count() or 1
+        if page_count < PARALLEL_EXTRACT_MIN_PAGES or workers <= 1:
+            return [(0, page_count)]
+
+        workers = min(workers, page_count)
+        step, extra = divmod(page_count, workers)
+        ranges = []
+        start = 0
+        for index in range(workers):
+            stop = start + step + (1 if index < extra else 0)
+            ranges.append((start, stop))
+            start = stop
+        return ranges
+
+    def _extract_pages_in_parallel(
+        self, file_path: str, ranges: List[Tuple[int, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract page ranges in worker processes, keeping page order.
+
+        PyPDF2 parses pages in pure Python and PyMuPDF documents must not be
+        shared across threads, so both backends use processes. Falls back to
+        in-process extraction if the pool cannot be used.
+
+        Args:
+            file_path: Path to the PDF file
+            ranges: (start, stop) page ranges, one per worker
+
+        Returns:
+            List of paragraph dictionaries in page order
+        """
+        try:
+            with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(
+                        _extract_page_range, file_path, start, stop, self.backend
+                    )
+                    for start, stop in ranges
+                ]
+                text_data = []
+                for future in futures:
+                    text_data.extend(future.result())
+            logger.info(f"Extracted {ranges[-1][1]} pages with {len(ranges)} processes")
+            return text_data
+        except Exception as e:
+            logger.warning(
+                f"Parallel PDF extraction failed, extracting in-process: {e}"
+            )
+            return _extract_page_range(file_path, 0, ranges[-1][1], self.backend)
+
     def translate_and_save(
         self, file_path: str, output_path: str, target_language: str = "en"
     ) -> bool:
@@ -147,7 +356,9 @@ class PDFProcessor(BaseProcessor):
             logger.info("Step 2: Translating texts...")
             original_texts = [item["text"] for item in text_data]
             unique_texts, metadata = self.preprocess_texts(original_texts)
-            translated_unique = self.translate_texts(unique_texts, target_language)
+            translated_unique = self.translate_texts_concurrently(
+                unique_texts, target_language
+            )
             translated_texts = self.postprocess_translations(
                 original_texts, translated_unique, metadata
             )
@@ -196,23 +407,27 @@ class PDFProcessor(BaseProcessor):
                 output_path = output_path.with_suffix(".txt")
                 logger.info(f"Saving as text file: {output_path}")
 
+            # Assemble the document in memory and write it in one call
+            parts = ["Translated PDF Content\n", "=" * 50 + "\n\n"]
+            page_separator = "\n" + "-" * 30 + "\n\n"
+            page_header = "Page {}\n" + "-" * 10 + "\n\n"
+
+            current_page = None
+            for item, translated_text in zip(text_data, translated_texts):
+                page_num = item.get("page_number", 1)
+
+                # Add page header if page changed
+                if current_page != page_num:
+                    if current_page is not None:
+                        parts.append(page_separator)
+                    parts.append(page_header.format(page_num))
+                    current_page = page_num
+
+                parts.append(translated_text)
+                parts.append("\n\n")
+
             with open(output_path, "w", encoding="utf-8") as f:
-                f.write("Translated PDF Content\n")
-                f.write("=" * 50 + "\n\n")
-
-                current_page = None
-                for item, translated_text in zip(text_data, translated_texts):
-                    page_num = item.get("page_number", 1)
-
-                    # Add page header if page changed
-                    if current_page != page_num:
-                        if current_page is not None:
-                            f.write("\n" + "-" * 30 + "\n\n")
-                        f.write(f"Page {page_num}\n")
-                        f.write("-" * 10 + "\n\n")
-                        current_page = page_num
-
-                    f.write(translated_text + "\n\n")
+                f.write("".join(parts))
 
             logger.info(f"Successfully saved translated content to: {output_path}")
             return True
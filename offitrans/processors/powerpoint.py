@@ -6,12 +6,13 @@ while preserving layout and formatting.
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 try:
     from pptx import Presentation
     from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE
+    from pptx.util import Pt
 
     PYTHON_PPTX_AVAILABLE = True
 except ImportError:
@@ -22,6 +23,92 @@ from ..exceptions.errors import PowerPointProcessorError
 
 logger = logging.getLogger(__name__)
 
+# Shape geometry attributes recorded by _extract_shape_info
+_GEOMETRY_ATTRS = ("width", "height", "left", "top")
+
+# Per shape class: (geometry attributes, has text, has text frame). python-pptx
+# decides these by class, so each concrete shape class is probed only once
+_SHAPE_CAPABILITIES: Dict[type, Tuple[Tuple[str, ...], bool, bool]] = {}
+
+
+def _shape_capabilities(shape) -> Tuple[Tuple[str, ...], bool, bool]:
+    """
+    Return which text and geometry attributes a shape's class provides.
+
+    Args:
+        shape: python-pptx shape object
+
+    Returns:
+        Tuple of (geometry attribute names, has ``text``, has ``text_frame``)
+    """
+    shape_class = type(shape)
+    capabilities = _SHAPE_CAPABILITIES.get(shape_class)
+    if capabilities is None:
+        capabilities = (
+            tuple(name for name in _GEOMETRY_ATTRS if hasattr(shape_class, name)),
+            hasattr(shape_class, "text"),
+            hasattr(shape_class, "text_frame"),
+        )
+        _SHAPE_CAPABILITIES[shape_class] = capabilities
+    return capabilities
+
+
+class SlideTextRecord:
+    """
+    Lightweight record for one extracted shape or paragraph text.
+
+    Uses ``__slots__`` to keep per-item memory low on large presentations.
+    Dict-style access (``record["text"]``, ``record.get("text")``) is kept for
+    callers that still treat extracted items as dictionaries; fields that do
+    not apply to the record type are ``None`` and ``get`` falls back to its
+    default for them.
+    """
+
+    __slots__ = (
+        "text",
+        "slide_index",
+        "shape_index",
+        "paragraph_index",
+        "type",
+        "shape_info",
+        "paragraph_info",
+    )
+
+    def __init__(
+        self,
+        text: str,
+        slide_index: int,
+        shape_index: int,
+        type: str,
+        paragraph_index: Optional[int] = None,
+        shape_info: Optional[Dict[str, Any]] = None,
+        paragraph_info: Optional[Dict[str, Any]] = None,
+    ):
+        self.text = text
+        self.slide_index = slide_index
+        self.shape_index = shape_index
+        self.type = type
+        self.paragraph_index = paragraph_index
+        self.shape_info = shape_info
+        self.paragraph_info = paragraph_info
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup returning ``default`` for unset or unknown keys."""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __repr__(self) -> str:
+        return (
+            f"SlideTextRecord({self.type}, slide {self.slide_index}, "
+            f"shape {self.shape_index}, {self.text[:30]!r})"
+        )
+
 
 class PowerPointProcessor(BaseProcessor):
     """
@@ -62,7 +149,7 @@ class PowerPointProcessor(BaseProcessor):
         supported_extensions = {".pptx", ".ppt"}
         return Path(file_path).suffix.lower() in supported_extensions
 
-    def extract_text(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_text(self, file_path: str) -> List[SlideTextRecord]:
         """
         Extract text content from PowerPoint presentation.
 
@@ -70,9 +157,27 @@ class PowerPointProcessor(BaseProcessor):
             file_path: Path to the PowerPoint file
 
         Returns:
-            List of dictionaries containing text and metadata
+            List of SlideTextRecord items containing text and metadata
+        """
+        _, text_data = self._load_and_extract(file_path)
+        return text_data
+
+    def _load_and_extract(self, file_path: str) -> Tuple[Any, List[SlideTextRecord]]:
+        """
+        Open a PowerPoint file and extract its text, keeping the presentation.
+
+        The returned presentation can be handed straight to
+        ``_replace_text_with_format`` so the file is only parsed once.
+
+        Args:
+            file_path: Path to the PowerPoint file
+
+        Returns:
+            Tuple of (python-pptx presentation, text data list)
         """
         text_data = []
+        # Repeated texts (template titles, footers) share one string object
+        seen: Dict[str, str] = {}
 
         try:
             prs = Presentation(file_path)
@@ -80,55 +185,77 @@ class PowerPointProcessor(BaseProcessor):
             logger.info(f"Presentation has {len(prs.slides)} slides")
 
             for slide_idx, slide in enumerate(prs.slides):
-                logger.debug(f"Processing slide {slide_idx + 1}")
+                logger.debug("Processing slide %d", slide_idx + 1)
 
                 # Extract text from shapes
                 for shape_idx, shape in enumerate(slide.shapes):
-                    if hasattr(shape, "text") and shape.text.strip():
+                    # Shapes without a text body have no text; reading .text or
+                    # .text_frame on them would add an empty body to the
+                    # presentation that is later saved
+                    if not shape.has_text_frame:
+                        continue
+
+                    # Walk the paragraphs once; python-pptx builds shape.text
+                    # as exactly this newline join of the paragraph texts
+                    paragraphs = shape.text_frame.paragraphs
+                    paragraph_texts = [paragraph.text for paragraph in paragraphs]
+                    shape_text = "\n".join(paragraph_texts)
+                    if shape_text.strip():
+                        shape_text = seen.setdefault(shape_text, shape_text)
+
                         # Get shape type and properties
                         shape_info = self._extract_shape_info(shape)
 
                         text_data.append(
-                            {
-                                "text": shape.text,
-                                "slide_index": slide_idx,
-                                "shape_index": shape_idx,
-                                "shape_info": shape_info,
-                                "type": "shape_text",
-                            }
+                            SlideTextRecord(
+                                shape_text,
+                                slide_idx,
+                                shape_idx,
+                                "shape_text",
+                                shape_info=shape_info,
+                            )
                         )
 
                         logger.debug(
-                            f"Extracted text from slide {slide_idx + 1}, shape {shape_idx}: '{shape.text[:50]}...'"
+                            "Extracted text from slide %d, shape %d: '%s...'",
+                            slide_idx + 1,
+                            shape_idx,
+                            shape_text[:50],
                         )
 
                     # Extract text from text frames within shapes
-                    if hasattr(shape, "text_frame"):
-                        for para_idx, paragraph in enumerate(
-                            shape.text_frame.paragraphs
-                        ):
-                            if paragraph.text.strip():
-                                para_info = self._extract_paragraph_info(paragraph)
-
-                                text_data.append(
-                                    {
-                                        "text": paragraph.text,
-                                        "slide_index": slide_idx,
-                                        "shape_index": shape_idx,
-                                        "paragraph_index": para_idx,
-                                        "paragraph_info": para_info,
-                                        "type": "paragraph_text",
-                                    }
+                    for para_idx, (paragraph, paragraph_text) in enumerate(
+                        zip(paragraphs, paragraph_texts)
+                    ):
+                        if paragraph_text.strip():
+                            paragraph_text = seen.setdefault(
+                                paragraph_text, paragraph_text
+                            )
+                            para_info = self._extract_paragraph_info(paragraph)
+
+                            text_data.append(
+                                SlideTextRecord(
+                                    paragraph_text,
+                                    slide_idx,
+                                    shape_idx,
+                                    "paragraph_text",
+                                    paragraph_index=para_idx,
+                                    paragraph_info=para_info,
                                 )
+                            )
 
-                                logger.debug(
-                                    f"Extracted paragraph from slide {slide_idx + 1}, shape {shape_idx}, para {para_idx}: '{paragraph.text[:50]}...'"
-                                )
+                            logger.debug(
+                                "Extracted paragraph from slide %d, shape %d, para %d: '%s...'",
+                                slide_idx + 1,
+                                shape_idx,
+                                para_idx,
+                                paragraph_text[:50],
+                            )
 
             logger.info(
                 f"Total extracted {len(text_data)} text elements from PowerPoint"
             )
-            return text_data
+            return prs, text_data
 
         except Exception as e:
             raise PowerPointProcessorError(
@@ -154,25 +281,37 @@ class PowerPointProcessor(BaseProcessor):
         try:
             # Step 1: Extract text and metadata
             logger.info("Step 1: Extracting text from PowerPoint presentation...")
-            text_data = self.extract_text(file_path)
+            prs, text_data = self._load_and_extract(file_path)
 
             if not text_data:
                 logger.warning("No translatable text found in PowerPoint presentation")
                 return False
 
-            # Step 2: Preprocess and translate texts
+            # Step 2: Preprocess and translate texts; only paragraphs are sent
+            # to the translator, as a shape's text is applied through its
+            # paragraphs and its own record only carries shape formatting
             logger.info("Step 2: Translating texts...")
-            original_texts = [item["text"] for item in text_data]
+            positions = [
+                i for i, item in enumerate(text_data) if item.type == "paragraph_text"
+            ]
+            original_texts = [text_data[i].text for i in positions]
             unique_texts, metadata = self.preprocess_texts(original_texts)
-            translated_unique = self.translate_texts(unique_texts, target_language)
-            translated_texts = self.postprocess_translations(
-                original_texts, translated_unique, metadata
+            translated_unique = self.translate_texts_concurrently(
+                unique_texts, target_language
             )
-
-            # Step 3: Apply translations to PowerPoint presentation
+            translated_texts = [item.text for item in text_data]
+            for i, translated_text in zip(
+                positions,
+                self.postprocess_translations(
+                    original_texts, translated_unique, metadata
+                ),
+            ):
+                translated_texts[i] = translated_text
+
+            # Step 3: Apply translations to the already loaded presentation
             logger.info("Step 3: Applying translations to PowerPoint presentation...")
             success = self._replace_text_with_format(
-                file_path, output_path, text_data, translated_texts, target_language
+                prs, output_path, text_data, translated_texts, target_language
             )
 
             if success:
@@ -190,9 +329,9 @@ class PowerPointProcessor(BaseProcessor):
 
     def _replace_text_with_format(
         self,
-        ppt_path: str,
+        prs,
         output_path: str,
-        text_data: List[Dict[str, Any]],
+        text_data: List[SlideTextRecord],
         translated_texts: List[str],
         target_language: str = "en",
     ) -> bool:
@@ -200,7 +339,7 @@ class PowerPointProcessor(BaseProcessor):
         Replace text in PowerPoint presentation while preserving formatting.
 
         Args:
-            ppt_path: Input PowerPoint file path
+            prs: Loaded python-pptx presentation (modified in place)
             output_path: Output PowerPoint file path
             text_data: Original text data with metadata
             translated_texts: List of translated texts
@@ -210,77 +349,68 @@ class PowerPointProcessor(BaseProcessor):
             True if successful, False otherwise
         """
         try:
-            prs = Presentation(ppt_path)
-
-            # Group translations by slide and shape
-            shape_translations = {}
-            paragraph_translations = {}
-
-            for item, translated_text in zip(text_data, translated_texts):
-                slide_idx = item["slide_index"]
-                shape_idx = item["shape_index"]
-
-                if item["type"] == "shape_text":
-                    key = (slide_idx, shape_idx)
-                    shape_translations[key] = {
-                        "text": translated_text,
-                        "shape_info": item.get("shape_info", {}),
-                    }
-                elif item["type"] == "paragraph_text":
-                    para_idx = item["paragraph_index"]
-                    key = (slide_idx, shape_idx, para_idx)
-                    paragraph_translations[key] = {
-                        "text": translated_text,
-                        "paragraph_info": item.get("paragraph_info", {}),
-                    }
-
-            # Apply shape text translations
-            for (slide_idx, shape_idx), translation_info in shape_translations.items():
-                if slide_idx < len(prs.slides) and shape_idx < len(
-                    prs.slides[slide_idx].shapes
+            # Materialise the slide and shape collections once; indexing
+            # prs.slides[i].shapes rebuilds python-pptx's proxies on every access
+            slide_shapes = [list(slide.shapes) for slide in prs.slides]
+
+            # Visit items shape by shape, each shape's own text before its
+            # paragraphs so paragraph translations are applied last (as
+            # extract_text already orders them, making the sort a linear pass)
+            ordered = sorted(
+                zip(text_data, translated_texts),
+                key=lambda pair: (
+                    pair[0].slide_index,
+                    pair[0].shape_index,
+                    -1 if pair[0].paragraph_index is None else pair[0].paragraph_index,
+                ),
+            )
+
+            for item, translated_text in ordered:
+                slide_idx = item.slide_index
+                shape_idx = item.shape_index
+                if slide_idx >= len(slide_shapes) or shape_idx >= len(
+                    slide_shapes[slide_idx]
                 ):
+                    continue
 
-                    shape = prs.slides[slide_idx].shapes[shape_idx]
-                    if hasattr(shape, "text"):
-                        shape.text = translation_info["text"]
+                shape = slide_shapes[slide_idx][shape_idx]
 
+                if item.type == "shape_text":
+                    # The shape's text is replaced paragraph by paragraph below;
+                    # reassigning shape.text would rebuild the text frame and
+                    # drop paragraph and run formatting
+                    if hasattr(shape, "text"):
                         # Apply formatting adjustments
                         self._apply_shape_format(
-                            shape, translation_info["shape_info"], target_language
+                            shape, item.shape_info or {}, target_language
                         )
 
                         logger.debug(
-                            f"Applied translation to slide {slide_idx + 1}, shape {shape_idx}"
-                        )
-
-            # Apply paragraph translations
-            for (
-                slide_idx,
-                shape_idx,
-                para_idx,
-            ), translation_info in paragraph_translations.items():
-                if slide_idx < len(prs.slides) and shape_idx < len(
-                    prs.slides[slide_idx].shapes
-                ):
-
-                    shape = prs.slides[slide_idx].shapes[shape_idx]
-                    if hasattr(shape, "text_frame") and para_idx < len(
-                        shape.text_frame.paragraphs
-                    ):
-
-                        paragraph = shape.text_frame.paragraphs[para_idx]
-                        paragraph.text = translation_info["text"]
-
-                        # Apply formatting adjustments
-                        self._apply_paragraph_format(
-                            paragraph,
-                            translation_info["paragraph_info"],
-                            target_language,
+                            "Applied translation to slide %d, shape %d",
+                            slide_idx + 1,
+                            shape_idx,
                         )
 
-                        logger.debug(
-                            f"Applied translation to slide {slide_idx + 1}, shape {shape_idx}, paragraph {para_idx}"
-                        )
+                elif item.type == "paragraph_text":
+                    # Apply paragraph translation
+                    para_idx = item.paragraph_index
+                    if hasattr(shape, "text_frame"):
+                        paragraphs = shape.text_frame.paragraphs
+                        if para_idx < len(paragraphs):
+                            paragraph = paragraphs[para_idx]
+                            self._set_paragraph_text(paragraph, translated_text)
+
+                            # Apply formatting adjustments
+                            self._apply_paragraph_format(
+                                paragraph, item.paragraph_info or {}, target_language
+                            )
+
+                            logger.debug(
+                                "Applied translation to slide %d, shape %d, paragraph %d",
+                                slide_idx + 1,
+                                shape_idx,
+                                para_idx,
+                            )
 
             # Save the presentation
             prs.save(output_path)
@@ -294,6 +424,34 @@ class PowerPointProcessor(BaseProcessor):
             logger.error(f"Error replacing text in PowerPoint presentation: {e}")
             return False
 
+    @staticmethod
+    def _set_paragraph_text(paragraph, text: str) -> None:
+        """
+        Replace a paragraph's text, editing its runs in place where possible.
+
+        The translation goes into the first run and the other runs are
+        removed, so the first run keeps its character formatting and
+        hyperlink. Paragraphs with line breaks or fields, or translations
+        containing line breaks, are rebuilt through ``paragraph.text``.
+
+        Args:
+            paragraph: python-pptx paragraph object
+            text: New paragraph text
+        """
+        runs = paragraph.runs
+        if (
+            not runs
+            or "\n" in text
+            or "\v" in text
+            or len(paragraph._p.content_children) != len(runs)
+        ):
+            paragraph.text = text
+            return
+
+        runs[0].text = text
+        for run in runs[1:]:
+            run._r.getparent().remove(run._r)
+
     def _extract_shape_info(self, shape) -> Dict[str, Any]:
         """
         Extract information from a shape.
@@ -309,22 +467,15 @@ class PowerPointProcessor(BaseProcessor):
         try:
             shape_info["shape_type"] = str(shape.shape_type)
 
-            if hasattr(shape, "width"):
-                shape_info["width"] = shape.width
-            if hasattr(shape, "height"):
-                shape_info["height"] = shape.height
-            if hasattr(shape, "left"):
-                shape_info["left"] = shape.left
-            if hasattr(shape, "top"):
-                shape_info["top"] = shape.top
+            geometry_attrs, _, has_text_frame = _shape_capabilities(shape)
+            for name in geometry_attrs:
+                shape_info[name] = getattr(shape, name)
 
             # Text frame properties
-            if hasattr(shape, "text_frame"):
+            if has_text_frame:
                 text_frame = shape.text_frame
-                if hasattr(text_frame, "auto_size"):
-                    shape_info["auto_size"] = text_frame.auto_size
-                if hasattr(text_frame, "word_wrap"):
-                    shape_info["word_wrap"] = text_frame.word_wrap
+                shape_info["auto_size"] = text_frame.auto_size
+                shape_info["word_wrap"] = text_frame.word_wrap
 
         except Exception as e:
             logger.error(f"Error extracting shape info: {e}")
@@ -344,21 +495,18 @@ class PowerPointProcessor(BaseProcessor):
         para_info = {}
 
         try:
-            if hasattr(paragraph, "alignment"):
-                para_info["alignment"] = paragraph.alignment
-            if hasattr(paragraph, "level"):
-                para_info["level"] = paragraph.level
-
-            # Font information from runs
-            if paragraph.runs:
-                first_run = paragraph.runs[0]
-                if hasattr(first_run, "font"):
-                    font = first_run.font
-                    para_info["font_name"] = font.name
-                    para_info["font_size"] = font.size
-                    para_info["bold"] = font.bold
-                    para_info["italic"] = font.italic
-                    para_info["underline"] = font.underline
+            para_info["alignment"] = paragraph.alignment
+            para_info["level"] = paragraph.level
+
+            # Font information from the first run
+            runs = paragraph.runs
+            if runs:
+                font = runs[0].font
+                para_info["font_name"] = font.name
+                para_info["font_size"] = font.size
+                para_info["bold"] = font.bold
+                para_info["italic"] = font.italic
+                para_info["underline"] = font.underline
 
         except Exception as e:
             logger.error(f"Error extracting paragraph info: {e}")
@@ -402,7 +550,7 @@ class PowerPointProcessor(BaseProcessor):
                                         6,
                                         int(original_size * self.font_size_adjustment),
                                     )
-                                    run.font.size = adjusted_size
+                                    run.font.size = Pt(adjusted_size)
 
         except Exception as e:
             logger.error(f"Error applying shape format: {e}")
@@ -438,13 +586,14 @@ class PowerPointProcessor(BaseProcessor):
                     elif para_info.get("font_name"):
                         font.name = para_info["font_name"]
 
-                    # Font size adjustment
+                    # Font size adjustment, from the extracted size so that a
+                    # run already scaled by _apply_shape_format is not scaled twice
                     if para_info.get("font_size") and font.size:
-                        original_size = font.size.pt
+                        original_size = para_info["font_size"].pt
                         adjusted_size = max(
                             6, int(original_size * self.font_size_adjustment)
                         )
-                        font.size = adjusted_size
+                        font.size = Pt(adjusted_size)
 
                     # Other font properties
                     if para_info.get("bold") is not None:
@@ -169,7 +169,9 @@ class WordProcessor(BaseProcessor):
             logger.info("Step 2: Translating texts...")
             original_texts = [item["text"] for item in text_data]
             unique_texts, metadata = self.preprocess_texts(original_texts)
-            translated_unique = self.translate_texts(unique_texts, target_language)
+            translated_unique = self.translate_texts_concurrently(
+                unique_texts, target_language
+            )
             translated_texts = self.postprocess_translations(
                 original_texts, translated_unique, metadata
             )
@@ -244,7 +246,7 @@ class WordProcessor(BaseProcessor):
                         run, para_info.get("format", {}), target_language
                     )
 
-                    logger.debug(f"Applied translation to paragraph {para_idx}")
+                    logger.debug("Applied translation to paragraph %d", para_idx)
 
             # Apply table cell translations
             for (
@@ -7,15 +7,21 @@ functionality like rate limiting, error handling, and retry logic.
 
 import time
 import logging
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from abc import abstractmethod
 
 from ..core.base import BaseTranslator
-from ..core.cache import cached_translation
+from ..core.cache import cached_translation, get_global_cache
 from ..exceptions.errors import TranslationError, ConfigError
 
 logger = logging.getLogger(__name__)
 
+# Limits for packing several texts into one batch request
+BATCH_MAX_CHARS = 4500
+BATCH_MAX_ITEMS = 128
+
 
 class BaseAPITranslator(BaseTranslator):
     """
@@ -53,8 +59,9 @@ class BaseAPITranslator(BaseTranslator):
         self.rate_limit_window = rate_limit_window
         self.proxies = proxies
 
-        # Rate limiting tracking
+        # Rate limiting tracking, shared by the batch worker threads
         self._request_times = []
+        self._rate_limit_lock = threading.Lock()
 
         # Validate configuration
         self._validate_config()
@@ -82,26 +89,32 @@ class BaseAPITranslator(BaseTranslator):
         Raises:
             TranslationError: If rate limit is exceeded
         """
-        current_time = time.time()
-
-        # Remove old requests outside the window
-        self._request_times = [
-            t for t in self._request_times if current_time - t < self.rate_limit_window
-        ]
-
-        # Check if we're at the limit
-        if len(self._request_times) >= self.rate_limit_requests:
-            oldest_request = min(self._request_times)
-            wait_time = self.rate_limit_window - (current_time - oldest_request)
-
-            if wait_time > 0:
-                logger.warning(
-                    f"Rate limit reached. Waiting {wait_time:.1f} seconds..."
-                )
-                time.sleep(wait_time)
+        # Held while waiting too, so concurrent callers queue for free slots
+        # instead of all passing the check at once
+        with self._rate_limit_lock:
+            current_time = time.time()
+
+            # Remove old requests outside the window
+            self._request_times = [
+                t
+                for t in self._request_times
+                if current_time - t < self.rate_limit_window
+            ]
+
+            # Check if we're at the limit
+            if len(self._request_times) >= self.rate_limit_requests:
+                oldest_request = min(self._request_times)
+                wait_time = self.rate_limit_window - (current_time - oldest_request)
+
+                if wait_time > 0:
+                    logger.warning(
+                        f"Rate limit reached. Waiting {wait_time:.1f} seconds..."
+                    )
+                    time.sleep(wait_time)
+                    current_time = time.time()
 
-        # Record this request
-        self._request_times.append(current_time)
+            # Record this request
+            self._request_times.append(current_time)
 
     def _make_request_with_retry(self, request_func, *args, **kwargs) -> Any:
         """
@@ -201,6 +214,145 @@ class BaseAPITranslator(BaseTranslator):
         """
         pass
 
+    @property
+    def supports_batch_api(self) -> bool:
+        """Whether ``_translate_api_call_batch`` sends one request per batch."""
+        return False
+
+    def _translate_api_call_batch(self, texts: List[str]) -> List[str]:
+        """
+        Make one API call that translates several texts.
+
+        Subclasses whose API accepts multiple texts per request override this
+        together with ``supports_batch_api``.
+
+        Args:
+            texts: Texts to translate
+
+        Returns:
+            Translated texts in the same order
+
+        Raises:
+            TranslationError: If API call fails
+        """
+        return [self._translate_api_call(text) for text in texts]
+
+    def _pack_batches(self, texts: List[str]) -> List[List[str]]:
+        """
+        Greedily pack texts into batches bounded by characters and item count.
+
+        Args:
+            texts: Texts to pack (each no longer than BATCH_MAX_CHARS)
+
+        Returns:
+            List of batches, in input order
+        """
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_chars = 0
+        for text in texts:
+            if current and (
+                current_chars + len(text) > BATCH_MAX_CHARS
+                or len(current) >= BATCH_MAX_ITEMS
+            ):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(text)
+            current_chars += len(text)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _translate_batch_request(self, batch: List[str]) -> List[str]:
+        """
+        Translate one packed batch, falling back to per-text calls on failure.
+
+        Args:
+            batch: Texts to translate in one request
+
+        Returns:
+            Translated texts in the same order
+        """
+        try:
+            translated = self._make_request_with_retry(
+                self._translate_api_call_batch, batch
+            )
+            if len(translated) != len(batch):
+                raise TranslationError(
+                    f"Batch response has {len(translated)} results "
+                    f"for {len(batch)} texts"
+                )
+        except Exception as e:
+            # Already on a batch worker thread, so do not start another pool
+            logger.warning(f"Batch request failed, translating texts one by one: {e}")
+            return super().translate_text_sequential(batch)
+
+        for text in batch:
+            self._update_stats(success=True, chars=len(text))
+        return translated
+
+    def translate_text_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate a batch of texts, packing them into few API requests.
+
+        Cached texts are served from the translation cache. The rest are
+        packed into requests of up to BATCH_MAX_ITEMS texts and
+        BATCH_MAX_CHARS characters, each counted once by the rate limiter.
+        Longer texts, and translators without a batch API, use the
+        per-text path.
+
+        Args:
+            texts: List of text strings to translate.
+
+        Returns:
+            List of translated text strings.
+        """
+        if not texts or not self.supports_batch_api:
+            return super().translate_text_batch(texts)
+
+        cache = get_global_cache() if self.enable_cache else None
+        results: List[Optional[str]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                results[index] = text
+                continue
+            cached = (
+                cache.get(text, self.source_lang, self.target_lang) if cache else None
+            )
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(text, []).append(index)
+
+        batchable = [text for text in pending if len(text) <= BATCH_MAX_CHARS]
+        oversized = [text for text in pending if len(text) > BATCH_MAX_CHARS]
+
+        translated: Dict[str, str] = {}
+        batches = self._pack_batches(batchable)
+        if batches:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(batches))
+            ) as executor:
+                for batch, batch_result in zip(
+                    batches, executor.map(self._translate_batch_request, batches)
+                ):
+                    translated.update(zip(batch, batch_result))
+        if oversized:
+            translated.update(zip(oversized, super().translate_text_batch(oversized)))
+
+        for text, translation in translated.items():
+            if cache and translation and translation != text:
+                cache.set(text, translation, self.source_lang, self.target_lang)
+            for index in pending[text]:
+                results[index] = translation
+
+        logger.info(
+            f"Batch translation completed: {len(texts)} texts, "
+            f"{len(batches)} batch requests"
+        )
+        return results
+
     @cached_translation()
     def translate_text(self, text: str) -> str:
         """
@@ -261,5 +413,6 @@ class BaseAPITranslator(BaseTranslator):
 
     def clear_rate_limit_history(self) -> None:
         """Clear rate limiting history."""
-        self._request_times.clear()
+        with self._rate_limit_lock:
+            self._request_times.clear()
         logger.info("Rate limit history cleared")
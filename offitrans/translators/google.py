@@ -9,7 +9,7 @@ import os
 import re
 import requests
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from .base_api import BaseAPITranslator
 from ..exceptions.errors import TranslationError
@@ -108,6 +108,28 @@ class GoogleTranslator(BaseAPITranslator):
         else:
             return self._translate_paid_api(text)
 
+    @property
+    def supports_batch_api(self) -> bool:
+        """The Cloud Translation API accepts repeated ``q`` parameters."""
+        return not self.use_free_api
+
+    def _translate_api_call_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate several texts with one Google Cloud Translation API request.
+
+        Args:
+            texts: Texts to translate
+
+        Returns:
+            Translated texts in the same order
+
+        Raises:
+            TranslationError: If API call fails
+        """
+        if self.use_free_api:
+            return super()._translate_api_call_batch(texts)
+        return self._translate_paid_api_batch(texts)
+
     def _translate_free_api(self, text: str) -> str:
         """
         Use the free Google Translate API.
@@ -252,6 +274,48 @@ class GoogleTranslator(BaseAPITranslator):
         except (KeyError, IndexError, TypeError) as e:
             raise TranslationError(f"Failed to parse API response: {e}") from e
 
+    def _translate_paid_api_batch(self, texts: List[str]) -> List[str]:
+        """
+        Use the paid Google Cloud Translation API for several texts at once.
+
+        Args:
+            texts: Texts to translate
+
+        Returns:
+            Translated texts in the same order
+        """
+        if not self.api_key:
+            raise TranslationError("API key required for Google Cloud Translation API")
+
+        try:
+            params = {
+                "key": self.api_key,
+                "q": texts,
+                "target": self.target_lang,
+                "format": "text",
+            }
+
+            # Add source language if not auto-detect
+            if self.source_lang != "auto":
+                params["source"] = self.source_lang
+
+            response = requests.post(
+                self.api_url,
+                data=params,
+                timeout=self.timeout,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                proxies=self.proxies,
+            )
+            response.raise_for_status()
+
+            translations = response.json()["data"]["translations"]
+            return [html.unescape(item["translatedText"]) for item in translations]
+
+        except requests.exceptions.RequestException as e:
+            raise TranslationError(f"Request failed: {e}") from e
+        except (KeyError, IndexError, TypeError) as e:
+            raise TranslationError(f"Failed to parse API response: {e}") from e
+
     def _is_permanent_error(self, error: Exception) -> bool:
         """
         Check if an error is permanent for Google Translate API.
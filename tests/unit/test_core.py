@@ -163,6 +163,43 @@ class TestTranslationCache:
         assert stats["cache_file"] == str(cache_file)
         assert "file_exists" in stats
 
+    def test_decorated_translations_persist(self, temp_dir):
+        """Test translations cached by the decorator reload in a fresh cache"""
+        from offitrans.core.cache import cached_translation
+
+        cache_file = temp_dir / "persist_cache.json"
+        cache = TranslationCache(str(cache_file), auto_save_interval=3)
+
+        class Translator:
+            enable_cache = True
+            source_lang = "en"
+            target_lang = "es"
+
+            @cached_translation(cache)
+            def translate_text(self, text):
+                return f"es_{text}"
+
+        translator = Translator()
+        texts = ["one", "two", "three", "four"]
+        for text in texts:
+            translator.translate_text(text)
+
+        # Saved periodically, every auto_save_interval entries
+        reloaded = TranslationCache(str(cache_file))
+        assert [reloaded.get(text, "en", "es") for text in texts] == [
+            "es_one",
+            "es_two",
+            "es_three",
+            None,
+        ]
+
+        # The rest is saved on exit
+        cache._save_cache_on_exit()
+        reloaded = TranslationCache(str(cache_file))
+        assert [reloaded.get(text, "en", "es") for text in texts] == [
+            f"es_{text}" for text in texts
+        ]
+
 
 class TestConfig:
     """Test the Config class"""
@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
+from offitrans.core.config import Config
 from offitrans.processors.base import BaseProcessor
 from offitrans.processors import get_processor, get_processor_by_extension
 from offitrans.exceptions.errors import ProcessorError
@@ -109,6 +110,59 @@ class TestBaseProcessor:
         assert result == ["Hello", "World"]
         mock_translator.translate_text_batch.assert_called_once_with(texts)
 
+    def test_translate_texts_concurrently_preserves_order(self):
+        """Test chunked concurrent translation keeps input order"""
+        config = Config()
+        config.processor.translate_chunk_chars = 10
+
+        mock_translator = Mock()
+        mock_translator.translate_text_sequential.side_effect = lambda chunk: [
+            text.upper() for text in chunk
+        ]
+        processor = self.MockProcessor(translator=mock_translator, config=config)
+
+        texts = [f"text {i}" for i in range(10)]
+        result = processor.translate_texts_concurrently(texts, "en")
+
+        assert result == [text.upper() for text in texts]
+        assert mock_translator.translate_text_sequential.call_count > 1
+        mock_translator.translate_text_batch.assert_not_called()
+        assert processor.stats["total_texts_translated"] == len(texts)
+
+    def test_translate_texts_concurrently_uses_translate_workers(self):
+        """Test chunk workers are the only pool, bounded by translate_workers"""
+        import threading
+        import time
+
+        from offitrans.core.base import BaseTranslator
+
+        class SlowTranslator(BaseTranslator):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.active = 0
+                self.peak = 0
+                self.active_lock = threading.Lock()
+
+            def translate_text(self, text):
+                with self.active_lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                time.sleep(0.005)
+                with self.active_lock:
+                    self.active -= 1
+                return text.upper()
+
+        config = Config()
+        config.processor.translate_workers = 8
+        translator = SlowTranslator(max_workers=5)
+        processor = self.MockProcessor(translator=translator, config=config)
+
+        texts = [f"text {i}" for i in range(200)]
+        result = processor.translate_texts_concurrently(texts, "en")
+
+        assert result == [text.upper() for text in texts]
+        assert 5 < translator.peak <= 8
+
     def test_postprocess_translations(self):
         """Test translation post-processing"""
         processor = self.MockProcessor()
@@ -127,6 +181,20 @@ class TestBaseProcessor:
         assert len(result) == 3
         assert result[2] == "123"  # Non-translatable should remain unchanged
 
+    def test_postprocess_translations_with_duplicates(self):
+        """Test repeated texts map to their own translation"""
+        processor = self.MockProcessor()
+
+        original_texts = ["Hello", "Hello", "World", "123", "Hello"]
+        unique_texts, metadata = processor.preprocess_texts(original_texts)
+        translated_texts = [f"T-{text}" for text in unique_texts]
+
+        result = processor.postprocess_translations(
+            original_texts, translated_texts, metadata
+        )
+
+        assert result == ["T-Hello", "T-Hello", "T-World", "123", "T-Hello"]
+
     def test_process_file_success(self, temp_dir):
         """Test successful file processing"""
         processor = self.MockProcessor()
@@ -209,6 +277,208 @@ class TestExcelProcessor:
 
                     ExcelProcessor()
 
+    def test_fast_extract_matches_openpyxl(self, temp_dir):
+        """Test the streaming extractor finds the same cells as openpyxl"""
+        try:
+            from openpyxl import Workbook
+            from offitrans.processors.excel import ExcelProcessor
+        except ImportError:
+            pytest.skip("openpyxl not available")
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Data"
+        sheet["A1"] = "Hello world"
+        sheet["B2"] = 42
+        sheet["C3"] = "=SUM(B2:B2)"
+        sheet["AA10"] = "Another sentence"
+        workbook.create_sheet("Notes")["B1"] = "Hello world"
+        file_path = temp_dir / "fast.xlsx"
+        workbook.save(file_path)
+
+        processor = ExcelProcessor(translator=Mock())
+        fast = processor._fast_extract_text(str(file_path))
+        processor.fast_extract = False
+        slow = processor.extract_text(str(file_path))
+
+        def key(item):
+            return (item.sheet_name, item.row, item.column, item.text)
+
+        assert fast is not None
+        assert [key(item) for item in fast] == [key(item) for item in slow]
+        assert fast[1].cell_coordinate == "AA10"
+
+    def test_fast_save_keeps_cell_styles(self, temp_dir):
+        """Test the write-only save path carries cell styles over"""
+        try:
+            from openpyxl import Workbook, load_workbook
+            from openpyxl.styles import Font
+            from offitrans.processors.excel import ExcelProcessor
+        except ImportError:
+            pytest.skip("openpyxl not available")
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet["A1"] = "Hello there world"
+        sheet["A1"].font = Font(name="Arial", bold=True)
+        sheet["A2"] = "Another longer sentence"
+        sheet["A2"].font = Font(name="Arial", bold=True)
+        input_path = temp_dir / "styled.xlsx"
+        output_path = temp_dir / "styled_out.xlsx"
+        workbook.save(input_path)
+
+        translator = Mock()
+        translator.translate_text_batch.side_effect = lambda texts: [
+            text.upper() for text in texts
+        ]
+        translator.translate_text_sequential.side_effect = (
+            translator.translate_text_batch.side_effect
+        )
+        processor = ExcelProcessor(translator=translator)
+        processor.fast_save = True
+
+        assert processor.translate_and_save(str(input_path), str(output_path))
+
+        result = load_workbook(output_path).active
+        for coordinate, text in (
+            ("A1", "HELLO THERE WORLD"),
+            ("A2", "ANOTHER LONGER SENTENCE"),
+        ):
+            assert result[coordinate].value == text
+            assert result[coordinate].font.name == "Arial"
+            assert result[coordinate].font.bold is True
+
+    def test_save_workbook_atomically_replaces_output(self, temp_dir):
+        """Test atomic saves apply the umask, keep modes and clean up on error"""
+        try:
+            from openpyxl import Workbook, load_workbook
+            from offitrans.processors.excel import ExcelProcessor
+        except ImportError:
+            pytest.skip("openpyxl not available")
+
+        import os
+
+        processor = ExcelProcessor(translator=Mock())
+        workbook = Workbook()
+        workbook.active["A1"] = "first"
+        output_path = temp_dir / "atomic.xlsx"
+
+        old_umask = os.umask(0o027)
+        try:
+            processor._save_workbook_atomically(workbook, str(output_path))
+        finally:
+            os.umask(old_umask)
+        assert os.stat(output_path).st_mode & 0o777 == 0o640
+
+        os.chmod(output_path, 0o600)
+        workbook.active["A1"] = "second"
+        processor._save_workbook_atomically(workbook, str(output_path))
+        assert os.stat(output_path).st_mode & 0o777 == 0o600
+        assert load_workbook(output_path).active["A1"].value == "second"
+
+        with patch.object(workbook, "save", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                processor._save_workbook_atomically(workbook, str(output_path))
+        assert load_workbook(output_path).active["A1"].value == "second"
+        assert sorted(os.listdir(temp_dir)) == ["atomic.xlsx"]
+
+    def test_merged_range_lookup(self):
+        """Test the row-bucketed merge index finds the covering range"""
+        try:
+            from openpyxl import Workbook
+            from offitrans.processors.excel import ExcelProcessor
+        except ImportError:
+            pytest.skip("openpyxl not available")
+
+        sheet = Workbook().active
+        for merged in ("B2:D3", "F2:G4", "A10:A12"):
+            sheet.merge_cells(merged)
+        processor = ExcelProcessor(translator=Mock())
+
+        def lookup(row, column):
+            info = processor._merged_range_at(sheet, row, column)
+            return info and info["range"]
+
+        # Top-left and interior cells
+        assert lookup(2, 2) == "B2:D3"
+        assert processor._merged_range_at(sheet, 2, 2)["top_left"] == "B2"
+        assert lookup(3, 3) == "B2:D3"
+        assert lookup(11, 1) == "A10:A12"
+
+        # Cells next to a range
+        assert lookup(2, 1) is None
+        assert lookup(2, 5) is None
+        assert lookup(4, 2) is None
+        assert lookup(9, 1) is None
+
+        # Ranges sharing rows but not columns
+        assert lookup(3, 6) == "F2:G4"
+        assert lookup(4, 7) == "F2:G4"
+        assert lookup(4, 4) is None
+
+        # Every position agrees with a scan over the ranges
+        for row in range(1, 14):
+            for column in range(1, 9):
+                expected = next(
+                    (
+                        str(merged)
+                        for merged in sheet.merged_cells.ranges
+                        if merged.min_row <= row <= merged.max_row
+                        and merged.min_col <= column <= merged.max_col
+                    ),
+                    None,
+                )
+                assert lookup(row, column) == expected
+
+    def test_smart_adjust_column_width_matches_column_scan(self):
+        """Test the one-pass width measurement matches a full column scan"""
+        try:
+            import datetime
+
+            from openpyxl import Workbook
+            from offitrans.processors.excel import ExcelProcessor
+        except ImportError:
+            pytest.skip("openpyxl not available")
+
+        images = {"Sheet": [{"anchor_builder": ("two_cell", (2, 0, 0, 0, 3, 0, 5, 0))}]}
+
+        def build():
+            workbook = Workbook()
+            sheet = workbook.active
+            sheet["A1"] = "你好世界"
+            sheet["A2"] = "中文文本测试内容" * 3
+            sheet["B1"] = "x" * 80
+            sheet["C1"] = 12345.678
+            sheet["C2"] = datetime.date(2024, 1, 2)
+            sheet["C3"] = datetime.date(2024, 1, 2)
+            sheet["D1"] = "y" * 80
+            sheet["F3"] = "short"
+            return workbook
+
+        # Column-by-column scan, as the widths were computed before
+        expected = {}
+        sheet = build().active
+        for column in sheet.columns:
+            index = column[0].column
+            max_length = max(
+                (len(str(cell.value)) for cell in column if cell.value), default=0
+            )
+            if 2 <= index <= 3:
+                expected[column[0].column_letter] = min(max_length + 1, 30)
+            else:
+                expected[column[0].column_letter] = min(max_length + 2, 50)
+
+        processor = ExcelProcessor(translator=Mock())
+        processor.image_data = images
+        workbook = build()
+        processor._smart_adjust_column_width(workbook)
+
+        dimensions = workbook.active.column_dimensions
+        assert {letter: dimensions[letter].width for letter in expected} == expected
+        assert expected["A"] == 26
+        assert expected["B"] == 30
+        assert expected["D"] == 50
+
 
 @pytest.mark.requires_docx
 class TestWordProcessor:
@@ -245,6 +515,60 @@ class TestPowerPointProcessor:
         except ImportError:
             pytest.skip("python-pptx not available")
 
+    def test_translation_replaces_runs_in_place(self, temp_dir):
+        """Test paragraphs keep their first run's font and get scaled sizes"""
+        try:
+            from pptx import Presentation
+            from pptx.util import Inches, Pt
+            from offitrans.processors.powerpoint import PowerPointProcessor
+        except ImportError:
+            pytest.skip("python-pptx not available")
+
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        text_frame = slide.shapes.add_textbox(
+            Inches(1), Inches(1), Inches(6), Inches(2)
+        ).text_frame
+
+        # A multi-run paragraph, edited at run level
+        paragraph = text_frame.paragraphs[0]
+        for text in ("Hello ", "big ", "world"):
+            run = paragraph.add_run()
+            run.text = text
+            run.font.name = "Arial"
+            run.font.size = Pt(24)
+            run.font.bold = True
+
+        # A paragraph with a line break, rebuilt through paragraph.text
+        paragraph = text_frame.add_paragraph()
+        paragraph.add_run().text = "Line one"
+        paragraph.add_line_break()
+        paragraph.add_run().text = "line two"
+
+        input_path = temp_dir / "runs.pptx"
+        output_path = temp_dir / "runs_out.pptx"
+        presentation.save(input_path)
+
+        translator = Mock()
+        translator.translate_text_batch.side_effect = lambda texts: [
+            text.upper() for text in texts
+        ]
+        translator.translate_text_sequential.side_effect = (
+            translator.translate_text_batch.side_effect
+        )
+        processor = PowerPointProcessor(translator=translator)
+
+        assert processor.translate_and_save(str(input_path), str(output_path))
+
+        paragraphs = Presentation(output_path).slides[0].shapes[0].text_frame.paragraphs
+        runs = paragraphs[0].runs
+        assert len(runs) == 1
+        assert runs[0].text == "HELLO BIG WORLD"
+        assert runs[0].font.name == "Arial"
+        assert runs[0].font.bold is True
+        assert runs[0].font.size == Pt(int(24 * processor.font_size_adjustment))
+        assert paragraphs[1].text == "LINE ONE\vLINE TWO"
+
 
 class TestPDFProcessor:
     """Test PDF processor"""
@@ -261,6 +585,62 @@ class TestPDFProcessor:
         except ImportError:
             pytest.skip("PyPDF2 not available")
 
+    def test_page_ranges_cover_all_pages(self):
+        """Test pages are split into contiguous per-worker ranges"""
+        try:
+            from offitrans.processors.pdf import PDFProcessor
+        except ImportError:
+            pytest.skip("PyPDF2 not available")
+
+        processor = PDFProcessor(translator=Mock())
+        processor.extract_workers = 4
+
+        assert processor._page_ranges(3) == [(0, 3)]
+        assert processor._page_ranges(30) == [(0, 8), (8, 16), (16, 23), (23, 30)]
+
+        processor.extract_workers = 1
+        assert processor._page_ranges(30) == [(0, 30)]
+
+    def test_pymupdf_backend_matches_pypdf2(self, temp_dir):
+        """Test the PyMuPDF backend extracts the same pages and paragraphs"""
+        fitz = pytest.importorskip("fitz")
+        from offitrans.processors.pdf import (
+            PDF_BACKEND_PYMUPDF,
+            PDF_BACKEND_PYPDF2,
+            PDFProcessor,
+            _open_pages,
+            _page_text,
+        )
+
+        pdf_path = temp_dir / "backends.pdf"
+        document = fitz.open()
+        for page_num in range(3):
+            page = document.new_page()
+            page.insert_text(
+                (72, 72), f"Page {page_num + 1} opening line\nand its second line"
+            )
+        document.save(str(pdf_path))
+        document.close()
+
+        extracted = {}
+        for backend in (PDF_BACKEND_PYPDF2, PDF_BACKEND_PYMUPDF):
+            config = Config()
+            config.processor.pdf_backend = backend
+            processor = PDFProcessor(translator=Mock(), config=config)
+            assert processor.backend == backend
+            extracted[backend] = processor.extract_text(str(pdf_path))
+
+            with _open_pages(str(pdf_path), backend) as pages:
+                texts = [_page_text(pages[index], backend) for index in range(3)]
+            assert [" ".join(text.split()) for text in texts] == [
+                f"Page {page_num + 1} opening line and its second line"
+                for page_num in range(3)
+            ]
+
+        assert extracted[PDF_BACKEND_PYMUPDF] == extracted[PDF_BACKEND_PYPDF2]
+        page_numbers = [item["page_number"] for item in extracted[PDF_BACKEND_PYPDF2]]
+        assert page_numbers == [1, 2, 3]
+
 
 class TestProcessorFactory:
     """Test processor factory functions"""
@@ -225,6 +225,65 @@ class TestBaseAPITranslator:
             assert result2 == "translated_hello"
             mock_api.assert_not_called()
 
+    def test_translate_text_batch_packs_requests(self):
+        """Test batch-capable translators send packed requests in order"""
+
+        class BatchTranslator(self.MockAPITranslator):
+            supports_batch_api = True
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.batch_calls = []
+
+            def _translate_api_call_batch(self, texts):
+                self.batch_calls.append(list(texts))
+                return [f"batch_{text}" for text in texts]
+
+        translator = BatchTranslator(enable_cache=False)
+        texts = [f"text {i}" for i in range(200)] + ["text 0", "  "]
+
+        result = translator.translate_text_batch(texts)
+
+        assert result[:200] == [f"batch_text {i}" for i in range(200)]
+        assert result[200:] == ["batch_text 0", "  "]
+        assert len(translator.batch_calls) == 2
+        assert sum(len(call) for call in translator.batch_calls) == 200
+
+    def test_translate_text_batch_runs_batches_concurrently(self):
+        """Test packed batch requests are in flight at the same time"""
+        import threading
+        import time
+
+        class SlowBatchTranslator(self.MockAPITranslator):
+            supports_batch_api = True
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.active = 0
+                self.peak = 0
+                self.active_lock = threading.Lock()
+
+            def _translate_api_call_batch(self, texts):
+                with self.active_lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                time.sleep(0.05)
+                with self.active_lock:
+                    self.active -= 1
+                if "fallback" in texts:
+                    raise Exception("Bad request")
+                return [f"batch_{text}" for text in texts]
+
+        translator = SlowBatchTranslator(enable_cache=False, max_workers=4)
+        texts = [f"text {i}" for i in range(400)] + ["fallback"]
+
+        result = translator.translate_text_batch(texts)
+
+        # The last batch fails and is translated text by text
+        assert result[:384] == [f"batch_text {i}" for i in range(384)]
+        assert result[384:] == [f"translated_{text}" for text in texts[384:]]
+        assert translator.peak > 1
+
     def test_api_info(self):
         """Test getting API information"""
         translator = self.MockAPITranslator(